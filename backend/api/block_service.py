@@ -23,6 +23,8 @@ class BlockAPIService:
         self.blocks: Dict[str, Block] = {}
         self.block_libraries: Dict[str, BlockLibrary] = {}
         self.document_block_refs: Dict[str, List[BlockReference]] = {}  # document_id -> block_refs
+        # Bumped on every block change so clients can poll with since_version
+        self.blocks_version = 0
         
         # Create default library
         self._create_default_library()
@@ -91,6 +93,7 @@ class BlockAPIService:
 
             # Store block
             self.blocks[block.id] = block
+            self.blocks_version += 1
 
             # Add to default library
             default_lib = list(self.block_libraries.values())[0]
@@ -119,6 +122,13 @@ class BlockAPIService:
             category = request.get("category")
             search_query = request.get("search_query", "")
 
+            # Nothing changed since the client's last fetch
+            if request.get("since_version") == self.blocks_version:
+                return ProtobufConverters.create_success_response({
+                    "not_modified": True,
+                    "version": self.blocks_version
+                })
+
             blocks_list = []
 
             if library_id:
@@ -166,7 +176,8 @@ class BlockAPIService:
 
             return ProtobufConverters.create_success_response({
                 "blocks": blocks_list,
-                "total_count": len(blocks_list)
+                "total_count": len(blocks_list),
+                "version": self.blocks_version
             })
 
         except Exception as e:
@@ -245,6 +256,7 @@ class BlockAPIService:
             # Update modification time
             from datetime import datetime
             block.modified_at = datetime.utcnow()
+            self.blocks_version += 1
 
             return ProtobufConverters.create_success_response({
                 "block": {
@@ -293,6 +305,7 @@ class BlockAPIService:
 
             # Remove block
             del self.blocks[block_id]
+            self.blocks_version += 1
 
             # Remove all references if force delete
             if force_delete:
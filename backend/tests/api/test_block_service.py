@@ -124,6 +124,28 @@ class TestBlockAPIService:
         assert len(blocks) == 1
         assert blocks[0]["name"] == "Door"
 
+    def test_get_blocks_not_modified(self):
+        """Test polling blocks with the last version token."""
+        self._create_test_blocks()
+
+        response = self.block_service.get_blocks({})
+        version = response["version"]
+
+        response = self.block_service.get_blocks({"since_version": version})
+
+        assert response["success"] is True
+        assert response["not_modified"] is True
+        assert "blocks" not in response
+
+        # Any block change invalidates the token
+        block_id = next(iter(self.block_service.blocks))
+        self.block_service.delete_block({"block_id": block_id})
+        response = self.block_service.get_blocks({"since_version": version})
+
+        assert "not_modified" not in response
+        assert response["total_count"] == 2
+        assert response["version"] != version
+
     def test_get_block_success(self):
         """Test getting specific block."""
         # Create test block
@@ -1,6 +1,7 @@
 """Core CAD application logic."""
 
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -19,6 +20,9 @@ class CADApplication(QObject):
     current_document_changed = Signal(str)  # document_id
     settings_changed = Signal()
 
+    # Document ID used by operations that need one while no document is open
+    DEFAULT_DOCUMENT_ID = "default_doc"
+
     def __init__(self):
         super().__init__()
 
@@ -26,6 +30,8 @@ class CADApplication(QObject):
         self._current_document_id: Optional[str] = None
         self._recent_files: list[str] = []
         self._settings = QSettings()
+        self._settings_batch_depth = 0
+        self._settings_batch_dirty = False
 
         # Load settings
         self._load_settings()
@@ -214,5 +220,23 @@ class CADApplication(QObject):
     def set_setting(self, key: str, value: Any):
         """Set application setting."""
         self._settings.setValue(key, value)
+
+        if self._settings_batch_depth:
+            self._settings_batch_dirty = True
+            return
+
         self._settings.sync()
         self.settings_changed.emit()
+
+    @contextmanager
+    def batch_settings(self):
+        """Group set_setting() calls into a single sync and change notification."""
+        self._settings_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._settings_batch_depth -= 1
+            if not self._settings_batch_depth and self._settings_batch_dirty:
+                self._settings_batch_dirty = False
+                self._settings.sync()
+                self.settings_changed.emit()
@@ -11,7 +11,7 @@ import time
 from abc import ABC, abstractmethod
 from collections import deque
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from PySide6.QtCore import QObject, Signal
 
@@ -423,25 +423,96 @@ class CommandManager(QObject):
         """
         Get command history information.
 
+        Returns:
+            List of command information dictionaries
+        """
+        return self.build_history(*self.snapshot_stacks())
+
+    def snapshot_stacks(self) -> Tuple[List[Command], List[Command]]:
+        """
+        Copy the undo and redo stacks.
+
+        The copies can be handed to build_history() on another thread
+        while this manager keeps changing its own stacks.
+
+        Returns:
+            Tuple of (undo commands, redo commands), oldest first
+        """
+        return list(self.undo_stack), list(self.redo_stack)
+
+    @staticmethod
+    def build_history(
+        undo_commands: List[Command], redo_commands: List[Command]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build command history information from stack snapshots.
+
+        Args:
+            undo_commands: Commands on the undo stack, oldest first
+            redo_commands: Commands on the redo stack, oldest first
+
         Returns:
             List of command information dictionaries
         """
         history = []
 
         # Add undo stack (most recent first)
-        for command in reversed(self.undo_stack):
+        for command in reversed(undo_commands):
             info = command.get_detailed_info()
             info["stack"] = "undo"
             history.append(info)
 
         # Add redo stack
-        for command in reversed(self.redo_stack):
+        for command in reversed(redo_commands):
             info = command.get_detailed_info()
             info["stack"] = "redo"
             history.append(info)
 
         return history
 
+    def get_history_columns(
+        self,
+    ) -> Tuple[
+        List[str], List[str], List[str], List[Optional[float]], List[bool], List[float]
+    ]:
+        """
+        Get command history as parallel columns.
+
+        Returns:
+            Column lists as described in build_history_columns()
+        """
+        return self.build_history_columns(*self.snapshot_stacks())
+
+    @staticmethod
+    def build_history_columns(
+        undo_commands: List[Command], redo_commands: List[Command]
+    ) -> Tuple[
+        List[str], List[str], List[str], List[Optional[float]], List[bool], List[float]
+    ]:
+        """
+        Build command history from stack snapshots as parallel columns.
+
+        Rows are in the same order as build_history(), but no dictionary is
+        built per command.
+
+        Args:
+            undo_commands: Commands on the undo stack, oldest first
+            redo_commands: Commands on the redo stack, oldest first
+
+        Returns:
+            Tuple of (descriptions, types, states, execution times,
+            redo stack flags, timestamps) lists, one entry per command
+        """
+        commands = undo_commands[::-1] + redo_commands[::-1]
+        return (
+            [command.description for command in commands],
+            [command.command_type.value for command in commands],
+            [command.state.value for command in commands],
+            [command.execution_time for command in commands],
+            [False] * len(undo_commands) + [True] * len(redo_commands),
+            [command.timestamp for command in commands],
+        )
+
     def clear_history(self):
         """Clear all command history."""
         self.undo_stack.clear()
@@ -0,0 +1,120 @@
+"""Tests for the blocks panel client-side filtering."""
+
+import sys
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from qt_client.ui.panels.blocks_panel import BlocksPanel, _wildcard_pattern
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication instance for tests."""
+    if not QApplication.instance():
+        app = QApplication(sys.argv)
+    return QApplication.instance()
+
+
+@pytest.fixture
+def panel(qapp):
+    """Create a blocks panel showing a cached test library."""
+    panel = BlocksPanel(api_client=None)
+    panel.current_library_id = "default"
+    panel._library_cache["default"] = [
+        {
+            "id": "door",
+            "name": "Door",
+            "description": "Single swing door",
+            "category": "Architectural",
+            "tags": ["opening"],
+        },
+        {
+            "id": "window",
+            "name": "Window",
+            "description": "Double glazed window",
+            "category": "Architectural",
+            "tags": ["opening", "glass"],
+        },
+        {
+            "id": "motor",
+            "name": "Motor",
+            "description": "AC motor symbol",
+            "category": "Electrical",
+            "tags": ["rotating"],
+        },
+        {
+            "id": "bolt",
+            "name": "Bolt M8 (x2)",
+            "description": "Hex bolt",
+            "category": "Mechanical",
+            "tags": [],
+        },
+    ]
+    return panel
+
+
+def shown_ids(panel, search="", category="All"):
+    """Apply a search and category and get the ids of the listed blocks."""
+    panel.current_category = category
+    panel.search_edit.setText(search)
+    panel._apply_filters_and_display()
+    return list(panel.blocks_data)
+
+
+class TestWildcardPattern:
+    """Test search text to regex conversion."""
+
+    def test_substring(self):
+        """Test plain text matches anywhere, ignoring case."""
+        assert _wildcard_pattern("oto").search("Motor")
+        assert _wildcard_pattern("MOTOR").search("motor")
+        assert not _wildcard_pattern("door").search("Window")
+
+    def test_star(self):
+        """Test ``*`` matches any run of characters."""
+        assert _wildcard_pattern("d*r").search("Door")
+        assert _wildcard_pattern("w*w").search("Window")
+        assert not _wildcard_pattern("d*x").search("Door")
+
+    def test_question_mark(self):
+        """Test ``?`` matches exactly one character."""
+        assert _wildcard_pattern("d??r").search("Door")
+        assert not _wildcard_pattern("d?r").search("Door")
+
+    def test_regex_metacharacters_are_literal(self):
+        """Test regex syntax in search text is matched literally."""
+        assert _wildcard_pattern("(x2)").search("Bolt M8 (x2)")
+        assert not _wildcard_pattern("(x2)").search("Bolt M8 x2")
+        assert not _wildcard_pattern("b.lt").search("Bolt")
+        assert _wildcard_pattern("[").search("a[b")
+
+
+class TestFilters:
+    """Test category and search filtering of the cached library."""
+
+    def test_no_filters(self, panel):
+        """Test every cached block is listed without filters."""
+        assert shown_ids(panel) == ["door", "window", "motor", "bolt"]
+
+    def test_category(self, panel):
+        """Test the category filter."""
+        assert shown_ids(panel, category="Architectural") == ["door", "window"]
+        assert shown_ids(panel, category="Symbols") == []
+
+    def test_search_fields(self, panel):
+        """Test search matches names, descriptions and tags."""
+        assert shown_ids(panel, "motor") == ["motor"]
+        assert shown_ids(panel, "glazed") == ["window"]
+        assert shown_ids(panel, "opening") == ["door", "window"]
+
+    def test_search_wildcards(self, panel):
+        """Test wildcard and literal search text."""
+        assert shown_ids(panel, "w?ndow") == ["window"]
+        assert shown_ids(panel, "M8*(x2)") == ["bolt"]
+        assert shown_ids(panel, "m.tor") == []
+
+    def test_search_and_category(self, panel):
+        """Test search and category filters combine."""
+        assert shown_ids(panel, "o*", category="Electrical") == ["motor"]
+        assert shown_ids(panel, "glass", category="Electrical") == []
@@ -0,0 +1,143 @@
+"""Tests for the command history table model."""
+
+import random
+import sys
+
+import pytest
+from PySide6.QtCore import QPersistentModelIndex, Qt, QtMsgType, qInstallMessageHandler
+from PySide6.QtTest import QAbstractItemModelTester
+from PySide6.QtWidgets import QApplication
+
+from qt_client.ui.panels.history_panel import CommandHistoryModel
+
+STATES = ("completed", "failed", "executing", "undoing", "undone", "pending")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication instance for tests."""
+    if not QApplication.instance():
+        app = QApplication(sys.argv)
+    return QApplication.instance()
+
+
+@pytest.fixture
+def model(qapp):
+    """Create a history model checked by QAbstractItemModelTester."""
+    model = CommandHistoryModel()
+    tester = QAbstractItemModelTester(
+        model, QAbstractItemModelTester.FailureReportingMode.Warning
+    )
+
+    warnings = []
+
+    def handler(msg_type, context, message):
+        if msg_type != QtMsgType.QtDebugMsg:
+            warnings.append(message)
+
+    previous = qInstallMessageHandler(handler)
+    yield model
+    qInstallMessageHandler(previous)
+    del tester
+
+    assert not warnings
+
+
+def make_row(rng, timestamp):
+    """Create a random history row as a tuple in column order."""
+    return (
+        f"Command {timestamp}",
+        rng.choice(("line", "circle", "move", "delete")),
+        rng.choice(STATES),
+        rng.choice((None, rng.random())),
+        rng.random() < 0.3,
+        timestamp,
+    )
+
+
+def to_columns(rows):
+    """Transpose history rows into a columns tuple."""
+    return tuple(list(column) for column in zip(*rows)) or tuple([] for _ in range(6))
+
+
+def mutate(rng, rows, next_timestamp):
+    """Randomly remove, insert and modify rows of a snapshot."""
+    rows = [row for row in rows if rng.random() > 0.2]
+
+    for _ in range(rng.randint(0, 4)):
+        rows.insert(rng.randint(0, len(rows)), make_row(rng, next_timestamp))
+        next_timestamp += 1
+
+    for i, row in enumerate(rows):
+        if rng.random() < 0.2:
+            rows[i] = (
+                row[0],
+                row[1],
+                rng.choice(STATES),
+                rng.choice((None, rng.random())),
+                rng.random() < 0.3,
+                row[5],
+            )
+    return rows, next_timestamp
+
+
+def displayed_rows(model):
+    """Read back the descriptions and redo flags the model displays."""
+    return [
+        (model.index(row, 0).data(), model.index(row, 0).data(Qt.UserRole))
+        for row in range(model.rowCount())
+    ]
+
+
+def expected_rows(rows):
+    """Get the descriptions and redo buckets a snapshot should display."""
+    return [
+        (row[0], CommandHistoryModel.REDO_BUCKET if row[4] else None) for row in rows
+    ]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_snapshots(model, seed):
+    """Test successive random snapshots keep the model consistent."""
+    rng = random.Random(seed)
+    rows = [make_row(rng, timestamp) for timestamp in range(rng.randint(0, 12))]
+    next_timestamp = len(rows)
+    model.set_history(to_columns(rows))
+
+    changed = []
+    model.dataChanged.connect(
+        lambda top, bottom, roles=(): changed.append((top.row(), bottom.row()))
+    )
+
+    for _ in range(20):
+        old_rows = rows
+        rows, next_timestamp = mutate(rng, rows, next_timestamp)
+
+        # Track where each old row ends up and which rows are reported changed
+        persistent = [
+            (QPersistentModelIndex(model.index(row, 0)), old_row)
+            for row, old_row in enumerate(old_rows)
+        ]
+        changed.clear()
+        model.set_history(to_columns(rows))
+
+        assert model.rowCount() == len(rows)
+        assert displayed_rows(model) == expected_rows(rows)
+
+        # Rows whose content changed under a surviving index must be reported
+        for index, old_row in persistent:
+            if index.isValid() and rows[index.row()] != old_row:
+                assert any(top <= index.row() <= bottom for top, bottom in changed)
+
+
+def test_row_limit(model):
+    """Test the row limit windows the most recent commands."""
+    rng = random.Random(0)
+    rows = [make_row(rng, timestamp) for timestamp in range(10)]
+    model.set_history(to_columns(rows))
+
+    model.set_row_limit(4)
+    assert displayed_rows(model) == expected_rows(rows[:4])
+
+    model.set_row_limit(None)
+    assert displayed_rows(model) == expected_rows(rows)
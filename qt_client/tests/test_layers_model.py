@@ -0,0 +1,193 @@
+"""Tests for the layers table model."""
+
+import sys
+
+import pytest
+from PySide6.QtCore import Qt, QtMsgType, qInstallMessageHandler
+from PySide6.QtGui import QColor, QIcon
+from PySide6.QtTest import QAbstractItemModelTester
+from PySide6.QtWidgets import QApplication
+
+from qt_client.ui.panels.layers_panel import LayerProps, LayersModel, LayersPanel
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication instance for tests."""
+    if not QApplication.instance():
+        app = QApplication(sys.argv)
+    return QApplication.instance()
+
+
+@pytest.fixture
+def qt_warnings(qapp):
+    """Collect Qt warnings, such as QAbstractItemModelTester failures."""
+    warnings = []
+
+    def handler(msg_type, context, message):
+        if msg_type != QtMsgType.QtDebugMsg:
+            warnings.append(message)
+
+    previous = qInstallMessageHandler(handler)
+    yield warnings
+    qInstallMessageHandler(previous)
+
+
+@pytest.fixture
+def layers():
+    """Create a layers dict shared by the model."""
+    return {
+        name: LayerProps(name=name, color=QColor("#FF0000"))
+        for name in ("0", "walls", "doors", "windows")
+    }
+
+
+@pytest.fixture
+def model(layers, qt_warnings):
+    """Create a layers model checked by QAbstractItemModelTester."""
+    model = LayersModel(layers, QIcon())
+    tester = QAbstractItemModelTester(
+        model, QAbstractItemModelTester.FailureReportingMode.Warning
+    )
+    model.reset_layers()
+    yield model
+    del tester
+
+    assert not qt_warnings
+
+
+def changed_rows(model):
+    """Record the row ranges of dataChanged signals."""
+    changed = []
+    model.dataChanged.connect(
+        lambda top, bottom, roles=(): changed.append((top.row(), bottom.row()))
+    )
+    return changed
+
+
+def is_bold(model, name):
+    """Check whether a layer's name is shown in bold."""
+    index = model.index(model.row_of(name), LayersModel.NAME_COLUMN)
+    return index.data(Qt.ItemDataRole.FontRole) is not None
+
+
+def assert_rows_match(model, layers):
+    """Check the model rows and row index agree with the layers dict."""
+    assert model._names == list(layers)
+    assert model._rows == {name: row for row, name in enumerate(layers)}
+    for row, name in enumerate(layers):
+        index = model.index(row, LayersModel.NAME_COLUMN)
+        assert index.data() == name
+
+
+def test_remove_middle_row(model, layers):
+    """Test rows below a removed layer are re-indexed."""
+    model.remove_layer("walls")
+    del layers["walls"]
+
+    assert model.rowCount() == 3
+    assert model.row_of("walls") == -1
+    assert_rows_match(model, layers)
+
+
+def test_add_new_layer(model, layers):
+    """Test adding a layer appends a row."""
+    layers["roof"] = LayerProps(name="roof", color=QColor("#00FF00"))
+    model.add_layer("roof")
+
+    assert model.row_of("roof") == 4
+    assert_rows_match(model, layers)
+
+
+def test_add_existing_layer(model, layers):
+    """Test re-adding a listed layer only updates its own row."""
+    changed = changed_rows(model)
+    layers["doors"].line_type = "dashed"
+    model.add_layer("doors")
+
+    assert model.rowCount() == 4
+    assert changed == [(2, 2)]
+    index = model.index(2, LayersModel.TYPE_COLUMN)
+    assert index.data() == "dashed"
+
+
+def test_set_data_unchanged_visibility(model):
+    """Test setting the current visibility emits nothing."""
+    changed = changed_rows(model)
+    toggled = []
+    model.visibility_toggled.connect(lambda *args: toggled.append(args))
+
+    index = model.index(1, LayersModel.VISIBLE_COLUMN)
+    assert model.setData(index, Qt.CheckState.Checked.value, Qt.CheckStateRole)
+
+    assert changed == []
+    assert toggled == []
+
+
+def test_set_data_toggles_visibility(model, layers):
+    """Test unchecking a layer hides it and signals once."""
+    changed = changed_rows(model)
+    toggled = []
+    model.visibility_toggled.connect(lambda *args: toggled.append(args))
+
+    index = model.index(1, LayersModel.VISIBLE_COLUMN)
+    assert model.setData(index, Qt.CheckState.Unchecked.value, Qt.CheckStateRole)
+
+    assert layers["walls"].visible is False
+    assert index.data(Qt.CheckStateRole) == Qt.CheckState.Unchecked
+    assert toggled == [("walls", False)]
+    assert changed == [(1, 1)]
+
+
+def test_set_data_other_column(model):
+    """Test only the visibility column is checkable."""
+    index = model.index(1, LayersModel.NAME_COLUMN)
+    assert not model.setData(index, "renamed")
+
+
+def test_set_current_layer(model):
+    """Test only the old and new current rows are updated."""
+    model.set_current_layer("0")
+    changed = changed_rows(model)
+
+    model.set_current_layer("doors")
+
+    assert sorted(changed) == [(0, 0), (2, 2)]
+    assert is_bold(model, "doors")
+    assert not any(is_bold(model, name) for name in ("0", "walls", "windows"))
+
+
+def test_set_current_layer_none(model):
+    """Test clearing the current layer un-bolds it."""
+    model.set_current_layer("walls")
+    model.set_current_layer(None)
+
+    assert not any(is_bold(model, name) for name in model._names)
+
+
+def test_load_rows(qapp, qt_warnings):
+    """Test loading backend layers replaces the rows and current layer."""
+    panel = LayersPanel()
+    model = panel.layers_model
+    tester = QAbstractItemModelTester(
+        model, QAbstractItemModelTester.FailureReportingMode.Warning
+    )
+    panel.add_layer("walls", {})
+    panel.set_current_layer("walls")
+
+    panel._load_rows([{"name": "0"}, {"name": "roof"}, {"name": "floor"}])
+
+    assert_rows_match(model, panel.get_layers())
+    assert list(panel.get_layers()) == ["0", "roof", "floor"]
+    assert panel.get_current_layer() == "0"
+    assert panel.current_label.text() == "0"
+    assert is_bold(model, "0")
+
+    panel._load_rows([{"name": "roof"}])
+
+    assert_rows_match(model, panel.get_layers())
+    assert panel.get_current_layer() == "roof"
+    assert is_bold(model, "roof")
+
+    del tester
+    assert not qt_warnings
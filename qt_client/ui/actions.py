@@ -0,0 +1,58 @@
+"""Identifiers for user actions shared by the ribbon, menus and shortcuts."""
+
+from enum import IntEnum
+
+
+class ActionId(IntEnum):
+    """User action codes.
+
+    Values are contiguous from zero so handlers can be stored in a tuple
+    indexed by the code.
+    """
+
+    # File
+    NEW = 0
+    OPEN = 1
+    SAVE = 2
+    SAVE_AS = 3
+    EXIT = 4
+
+    # Edit
+    UNDO = 5
+    REDO = 6
+
+    # View
+    ZOOM_IN = 7
+    ZOOM_OUT = 8
+    ZOOM_FIT = 9
+    TOGGLE_GRID = 10
+    TOGGLE_SNAP = 11
+
+    # Drawing tools
+    SELECT = 12
+    LINE = 13
+    CIRCLE = 14
+    RECTANGLE = 15
+
+    # Modification tools
+    MOVE = 16
+    COPY = 17
+    ROTATE = 18
+    SCALE = 19
+    MIRROR = 20
+    TRIM = 21
+    EXTEND = 22
+    OFFSET = 23
+    FILLET = 24
+    CHAMFER = 25
+
+    # Annotation tools
+    DIM_LINEAR = 26
+    DIM_ANGULAR = 27
+    DIM_RADIUS = 28
+    TEXT = 29
+    LEADER = 30
+
+    # Block tools
+    BLOCK_CREATE = 31
+    BLOCK_INSERT = 32
@@ -2,10 +2,11 @@
 
 import asyncio
 import logging
+from functools import partial
 from typing import Optional
 
-from PySide6.QtCore import QPoint, Qt, QTimer, Signal
-from PySide6.QtGui import QAction, QIcon, QKeySequence
+from PySide6.QtCore import QPointF, QSignalBlocker, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QAction, QIcon, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -26,7 +27,9 @@ from qt_client.core.command_manager import CommandManager
 from qt_client.core.selection_manager import SelectionManager
 from qt_client.core.snap_engine import SnapEngine
 from qt_client.graphics.tools.tool_manager import ToolManager
+from qt_client.ui.actions import ActionId
 from qt_client.ui.canvas.cad_canvas_view import CADCanvasView
+from qt_client.ui.dialogs.export_dialog import ExportOptionsDialog
 from qt_client.ui.panels.layers_panel import LayersPanel
 from qt_client.ui.panels.properties_panel import PropertiesPanel
 from qt_client.ui.panels.blocks_panel import BlocksPanel
@@ -35,19 +38,282 @@ from qt_client.ui.ribbon.ribbon_widget import RibbonWidget
 logger = logging.getLogger(__name__)
 
 
+# Status bar coordinates are shown to 4 decimals; updates are gated on the
+# coordinates quantized to this many units per drawing unit
+COORD_QUANTUM = 10000
+
+
+# Parsed key sequences, shared by all windows
+_KEY_SEQUENCE_CACHE: dict[str | QKeySequence.StandardKey, QKeySequence] = {}
+
+
+def _key_sequence(key_sequence: str | QKeySequence.StandardKey) -> QKeySequence:
+    """Return the QKeySequence for a shortcut string or standard key, built once."""
+    sequence = _KEY_SEQUENCE_CACHE.get(key_sequence)
+    if sequence is None:
+        sequence = _KEY_SEQUENCE_CACHE[key_sequence] = QKeySequence(key_sequence)
+    return sequence
+
+
+def format_coordinates(x: float, y: float) -> str:
+    """Format world coordinates for the status bar."""
+    return "X: %.4f  Y: %.4f" % (x, y)
+
+
+def format_zoom(zoom_percent: int) -> str:
+    """Format a zoom percentage for the status bar."""
+    return "Zoom: %d%%" % zoom_percent
+
+
 class CADMainWindow(QMainWindow):
     """Main CAD application window."""
 
     # Signals
     window_closing = Signal()
 
+    # Status bar refresh interval (one update per ~60 Hz frame) for
+    # high-frequency view signals
+    STATUS_UPDATE_INTERVAL_MS = 16
+
+    # Traditional menu layout: (menu title, entries). An entry is None for a
+    # separator, (title, entries) for a submenu, or an action
+    # (key, text, shortcut, status tip, slot) where slot is a method name or
+    # a (method name, *args) tuple.
+    _MENU_SPEC = (
+        (
+            "&File",
+            (
+                (
+                    "new",
+                    "&New",
+                    QKeySequence.StandardKey.New,
+                    "Create a new document",
+                    "_new_document",
+                ),
+                (
+                    "open",
+                    "&Open...",
+                    QKeySequence.StandardKey.Open,
+                    "Open an existing document",
+                    "_open_document",
+                ),
+                None,
+                (
+                    "save",
+                    "&Save",
+                    QKeySequence.StandardKey.Save,
+                    "Save the current document",
+                    "_save_document",
+                ),
+                (
+                    "save_as",
+                    "Save &As...",
+                    QKeySequence.StandardKey.SaveAs,
+                    "Save the document with a new name",
+                    "_save_document_as",
+                ),
+                None,
+                (
+                    "&Export",
+                    (
+                        (
+                            "export_svg",
+                            "Export to &SVG...",
+                            None,
+                            "Export document to SVG format",
+                            ("_export_document", "svg"),
+                        ),
+                        (
+                            "export_pdf",
+                            "Export to &PDF...",
+                            None,
+                            "Export document to PDF format",
+                            ("_export_document", "pdf"),
+                        ),
+                        None,
+                        (
+                            "export_options",
+                            "Export &Options...",
+                            None,
+                            "Export document with custom options",
+                            "_export_with_options",
+                        ),
+                    ),
+                ),
+                None,
+                (
+                    "exit",
+                    "E&xit",
+                    QKeySequence.StandardKey.Quit,
+                    "Exit the application",
+                    "close",
+                ),
+            ),
+        ),
+        (
+            "&Edit",
+            (
+                (
+                    "undo",
+                    "&Undo",
+                    QKeySequence.StandardKey.Undo,
+                    "Undo the last action",
+                    None,
+                ),
+                (
+                    "redo",
+                    "&Redo",
+                    QKeySequence.StandardKey.Redo,
+                    "Redo the last undone action",
+                    None,
+                ),
+            ),
+        ),
+        (
+            "&View",
+            (
+                (
+                    "zoom_in",
+                    "Zoom &In",
+                    QKeySequence.StandardKey.ZoomIn,
+                    "Zoom in",
+                    "_zoom_in",
+                ),
+                (
+                    "zoom_out",
+                    "Zoom &Out",
+                    QKeySequence.StandardKey.ZoomOut,
+                    "Zoom out",
+                    "_zoom_out",
+                ),
+                (
+                    "zoom_fit",
+                    "Zoom &Fit",
+                    "Ctrl+0",
+                    "Zoom to fit all objects",
+                    "_zoom_fit",
+                ),
+            ),
+        ),
+        (
+            "&Tools",
+            (
+                (
+                    "line",
+                    "&Line",
+                    "L",
+                    "Draw a line",
+                    ("_activate_named_tool", ActionId.LINE),
+                ),
+                (
+                    "circle",
+                    "&Circle",
+                    "C",
+                    "Draw a circle",
+                    ("_activate_named_tool", ActionId.CIRCLE),
+                ),
+            ),
+        ),
+        (
+            "&Help",
+            (("about", "&About", None, "Show application information", "_show_about"),),
+        ),
+    )
+
+    # Toolbar action keys from _MENU_SPEC; None is a separator
+    _TOOLBAR_SPEC = (
+        "new",
+        "open",
+        "save",
+        None,
+        "undo",
+        "redo",
+        None,
+        "zoom_in",
+        "zoom_out",
+        "zoom_fit",
+    )
+
+    # Window-level keyboard shortcuts: (key sequence, ActionId) dispatched
+    # through _handle_action
+    _SHORTCUT_SPEC = (
+        # File shortcuts
+        ("Ctrl+N", ActionId.NEW),
+        ("Ctrl+O", ActionId.OPEN),
+        ("Ctrl+S", ActionId.SAVE),
+        ("Ctrl+Shift+S", ActionId.SAVE_AS),
+        ("Ctrl+Q", ActionId.EXIT),
+        # Edit shortcuts
+        ("Ctrl+Z", ActionId.UNDO),
+        ("Ctrl+Y", ActionId.REDO),
+        ("Ctrl+Shift+Z", ActionId.REDO),
+        # View shortcuts
+        ("Ctrl+=", ActionId.ZOOM_IN),
+        ("Ctrl+-", ActionId.ZOOM_OUT),
+        ("Ctrl+0", ActionId.ZOOM_FIT),
+        # Tool shortcuts
+        ("Escape", ActionId.SELECT),
+        ("L", ActionId.LINE),
+        ("C", ActionId.CIRCLE),
+        ("R", ActionId.RECTANGLE),
+        # Advanced tool shortcuts
+        ("M", ActionId.MOVE),
+        ("CP", ActionId.COPY),
+        ("RO", ActionId.ROTATE),
+        ("SC", ActionId.SCALE),
+        ("MI", ActionId.MIRROR),
+        ("TR", ActionId.TRIM),
+        ("EX", ActionId.EXTEND),
+        ("O", ActionId.OFFSET),
+        ("F", ActionId.FILLET),
+        ("CH", ActionId.CHAMFER),
+    )
+
+    # Tool action -> (tool manager name, mode text).
+    # A tool manager name of None only updates the mode display.
+    _TOOL_MODES = {
+        ActionId.SELECT: (None, "Select"),
+        ActionId.LINE: (None, "Line"),
+        ActionId.CIRCLE: (None, "Circle"),
+        ActionId.RECTANGLE: (None, "Rectangle"),
+        # Advanced modification tools
+        ActionId.MOVE: ("move", "Move"),
+        ActionId.COPY: ("copy", "Copy"),
+        ActionId.ROTATE: ("rotate", "Rotate"),
+        ActionId.SCALE: ("scale", "Scale"),
+        ActionId.MIRROR: ("mirror", "Mirror"),
+        ActionId.TRIM: ("trim", "Trim"),
+        ActionId.EXTEND: ("extend", "Extend"),
+        ActionId.OFFSET: ("offset", "Offset"),
+        ActionId.FILLET: ("fillet", "Fillet"),
+        ActionId.CHAMFER: ("chamfer", "Chamfer"),
+        # Block tools
+        ActionId.BLOCK_CREATE: ("block_create", "Create Block"),
+        ActionId.BLOCK_INSERT: ("block_insert", "Insert Block"),
+    }
+
+    # Non-tool action -> handler method name
+    _ACTION_TABLE = {
+        ActionId.NEW: "_new_document",
+        ActionId.OPEN: "_open_document",
+        ActionId.SAVE: "_save_document",
+        ActionId.SAVE_AS: "_save_document_as",
+        ActionId.EXIT: "close",
+        ActionId.UNDO: "_undo",
+        ActionId.REDO: "_redo",
+        ActionId.ZOOM_IN: "_zoom_in",
+        ActionId.ZOOM_OUT: "_zoom_out",
+        ActionId.ZOOM_FIT: "_zoom_fit",
+    }
+
     def __init__(self, cad_app: CADApplication, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
         self.cad_app = cad_app
 
         # Window properties
-        self.setWindowTitle("PyCAD 2D Professional")
+        self._current_title = ""
+        self._set_title("PyCAD 2D Professional")
         self.setGeometry(100, 100, 1400, 900)
         self.setMinimumSize(800, 600)
 
@@ -67,17 +333,52 @@ class CADMainWindow(QMainWindow):
 
         # UI components
         self._ribbon: Optional[RibbonWidget] = None
-        self._coord_label: Optional[QLabel] = None
-        self._zoom_label: Optional[QLabel] = None
-        self._mode_label: Optional[QLabel] = None
+
+        # Status bar labels exist from construction so handlers never need
+        # None checks; _setup_status_bar() places them in the status bar
+        self._coord_label = QLabel(format_coordinates(0.0, 0.0))
+        self._coord_label.setMinimumWidth(150)
+        self._zoom_label = QLabel(format_zoom(100))
+        self._zoom_label.setMinimumWidth(80)
+        self._mode_label = QLabel("Select")
+        self._mode_label.setMinimumWidth(80)
+        self._msg_label = QLabel()
+
+        self._shortcuts: list[QShortcut] = []
+        self._menu_key_sequences: set[str] = set()
+        self._export_msgbox: Optional[QMessageBox] = None
 
         # State
         self._use_ribbon = True  # Use ribbon interface vs traditional menu/toolbar
+        self._window_state_restored = False
+        self._connections_established = False
+        self._action_handlers = self._build_action_handlers()
+
+        # Throttled status bar updates
+        self._pending_coord: Optional[tuple[float, float]] = None
+        self._pending_zoom: Optional[float] = None
+        self._last_coord: Optional[tuple[int, int]] = None
+        self._last_zoom: Optional[int] = None
+
+        self._coord_timer = QTimer(self)
+        self._coord_timer.setSingleShot(True)
+        self._coord_timer.setInterval(self.STATUS_UPDATE_INTERVAL_MS)
+        self._coord_timer.timeout.connect(self._flush_coord)
+
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(self.STATUS_UPDATE_INTERVAL_MS)
+        self._zoom_timer.timeout.connect(self._flush_zoom)
+
+        # Clears transient status messages from the message label
+        self._msg_timer = QTimer(self)
+        self._msg_timer.setSingleShot(True)
+        self._msg_timer.timeout.connect(self._msg_label.clear)
 
         # Setup UI
         self._setup_ui()
         self._setup_connections()
-        self._restore_window_state()
+        # Window state is restored on first show, see showEvent()
 
         logger.info("Main window initialized")
 
@@ -108,152 +409,57 @@ class CADMainWindow(QMainWindow):
 
     def _setup_traditional_menu(self):
         """Setup traditional menu and toolbar."""
-        # Create menu bar
         menubar = self.menuBar()
+        actions: dict[str, QAction] = {}
 
-        # File menu
-        file_menu = menubar.addMenu("&File")
-
-        # New action
-        new_action = QAction("&New", self)
-        new_action.setShortcut(QKeySequence.StandardKey.New)
-        new_action.setStatusTip("Create a new document")
-        new_action.triggered.connect(self._new_document)
-        file_menu.addAction(new_action)
-
-        # Open action
-        open_action = QAction("&Open...", self)
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.setStatusTip("Open an existing document")
-        open_action.triggered.connect(self._open_document)
-        file_menu.addAction(open_action)
-
-        file_menu.addSeparator()
-
-        # Save action
-        save_action = QAction("&Save", self)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.setStatusTip("Save the current document")
-        save_action.triggered.connect(self._save_document)
-        file_menu.addAction(save_action)
-
-        # Save As action
-        save_as_action = QAction("Save &As...", self)
-        save_as_action.setShortcut(QKeySequence.StandardKey.SaveAs)
-        save_as_action.setStatusTip("Save the document with a new name")
-        save_as_action.triggered.connect(self._save_document_as)
-        file_menu.addAction(save_as_action)
-
-        file_menu.addSeparator()
-
-        # Export submenu
-        export_menu = file_menu.addMenu("&Export")
-        
-        # Export to SVG
-        export_svg_action = QAction("Export to &SVG...", self)
-        export_svg_action.setStatusTip("Export document to SVG format")
-        export_svg_action.triggered.connect(lambda: self._export_document("svg"))
-        export_menu.addAction(export_svg_action)
-        
-        # Export to PDF
-        export_pdf_action = QAction("Export to &PDF...", self)
-        export_pdf_action.setStatusTip("Export document to PDF format")
-        export_pdf_action.triggered.connect(lambda: self._export_document("pdf"))
-        export_menu.addAction(export_pdf_action)
-        
-        export_menu.addSeparator()
-        
-        # Export with options
-        export_options_action = QAction("Export &Options...", self)
-        export_options_action.setStatusTip("Export document with custom options")
-        export_options_action.triggered.connect(self._export_with_options)
-        export_menu.addAction(export_options_action)
-
-        file_menu.addSeparator()
-
-        # Exit action
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.setStatusTip("Exit the application")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Edit menu
-        edit_menu = menubar.addMenu("&Edit")
-
-        # Undo action
-        undo_action = QAction("&Undo", self)
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.setStatusTip("Undo the last action")
-        undo_action.setEnabled(False)  # TODO: Connect to undo system
-        edit_menu.addAction(undo_action)
-
-        # Redo action
-        redo_action = QAction("&Redo", self)
-        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.setStatusTip("Redo the last undone action")
-        redo_action.setEnabled(False)  # TODO: Connect to undo system
-        edit_menu.addAction(redo_action)
-
-        # View menu
-        view_menu = menubar.addMenu("&View")
-
-        # Zoom actions
-        zoom_in_action = QAction("Zoom &In", self)
-        zoom_in_action.setShortcut(QKeySequence.StandardKey.ZoomIn)
-        zoom_in_action.setStatusTip("Zoom in")
-        view_menu.addAction(zoom_in_action)
-
-        zoom_out_action = QAction("Zoom &Out", self)
-        zoom_out_action.setShortcut(QKeySequence.StandardKey.ZoomOut)
-        zoom_out_action.setStatusTip("Zoom out")
-        view_menu.addAction(zoom_out_action)
-
-        zoom_fit_action = QAction("Zoom &Fit", self)
-        zoom_fit_action.setShortcut(QKeySequence("Ctrl+0"))
-        zoom_fit_action.setStatusTip("Zoom to fit all objects")
-        view_menu.addAction(zoom_fit_action)
-
-        # Tools menu
-        tools_menu = menubar.addMenu("&Tools")
-
-        # Line tool
-        line_action = QAction("&Line", self)
-        line_action.setShortcut(QKeySequence("L"))
-        line_action.setStatusTip("Draw a line")
-        tools_menu.addAction(line_action)
-
-        # Circle tool
-        circle_action = QAction("&Circle", self)
-        circle_action.setShortcut(QKeySequence("C"))
-        circle_action.setStatusTip("Draw a circle")
-        tools_menu.addAction(circle_action)
-
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
-
-        # About action
-        about_action = QAction("&About", self)
-        about_action.setStatusTip("Show application information")
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        for menu_title, entries in self._MENU_SPEC:
+            self._populate_menu(menubar.addMenu(menu_title), entries, actions)
+
+        # TODO: Connect to undo system
+        actions["undo"].setEnabled(False)
+        actions["redo"].setEnabled(False)
 
         # Create toolbar
         toolbar = QToolBar("Main Toolbar", self)
         toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
         self.addToolBar(toolbar)
 
-        # Add actions to toolbar
-        toolbar.addAction(new_action)
-        toolbar.addAction(open_action)
-        toolbar.addAction(save_action)
-        toolbar.addSeparator()
-        toolbar.addAction(undo_action)
-        toolbar.addAction(redo_action)
-        toolbar.addSeparator()
-        toolbar.addAction(zoom_in_action)
-        toolbar.addAction(zoom_out_action)
-        toolbar.addAction(zoom_fit_action)
+        for key in self._TOOLBAR_SPEC:
+            if key is None:
+                toolbar.addSeparator()
+            else:
+                toolbar.addAction(actions[key])
+
+    def _populate_menu(self, menu, entries, actions: dict[str, QAction]):
+        """Fill a menu from a menu spec, recording created actions by key."""
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+            elif len(entry) == 2:
+                # Submenu: (title, entries)
+                title, sub_entries = entry
+                self._populate_menu(menu.addMenu(title), sub_entries, actions)
+            else:
+                key, text, shortcut, status_tip, slot = entry
+                action = QAction(text, self)
+                if shortcut is not None:
+                    key_sequence = _key_sequence(shortcut)
+                    action.setShortcut(key_sequence)
+                    if not key_sequence.isEmpty():
+                        self._menu_key_sequences.add(key_sequence.toString())
+                action.setStatusTip(status_tip)
+                if slot is not None:
+                    action.triggered.connect(self._resolve_slot(slot))
+                menu.addAction(action)
+                actions[key] = action
+
+    def _resolve_slot(self, slot):
+        """Resolve a slot spec (method name or (name, *args)) to a callable."""
+        if isinstance(slot, str):
+            return getattr(self, slot)
+
+        name, *args = slot
+        return partial(getattr(self, name), *args)
 
     def _setup_main_layout(self):
         """Setup the main window layout."""
@@ -282,21 +488,24 @@ class CADMainWindow(QMainWindow):
         self._layers_panel = LayersPanel(self, self.cad_app.api_client)
         self._blocks_panel = BlocksPanel(self.cad_app.api_client, self)
 
-        # Add panels to right splitter
-        right_splitter.addWidget(self._properties_panel)
-        right_splitter.addWidget(self._layers_panel)
-        right_splitter.addWidget(self._blocks_panel)
-        right_splitter.setSizes([200, 200, 200])  # Equal height for panels
-
-        # Add to main splitter
-        self._main_splitter.addWidget(self._drawing_area)
-        self._main_splitter.addWidget(right_splitter)
-
-        # Set splitter proportions (80% drawing area, 20% panels)
-        self._main_splitter.setSizes([1120, 280])
-        self._main_splitter.setCollapsible(
-            0, False
-        )  # Don't allow collapsing drawing area
+        # Configure both splitters with signals blocked so the batch of
+        # add/resize calls doesn't emit intermediate splitterMoved updates
+        with QSignalBlocker(right_splitter), QSignalBlocker(self._main_splitter):
+            # Add panels to right splitter
+            right_splitter.addWidget(self._properties_panel)
+            right_splitter.addWidget(self._layers_panel)
+            right_splitter.addWidget(self._blocks_panel)
+            right_splitter.setSizes([200, 200, 200])  # Equal height for panels
+
+            # Add to main splitter
+            self._main_splitter.addWidget(self._drawing_area)
+            self._main_splitter.addWidget(right_splitter)
+
+            # Set splitter proportions (80% drawing area, 20% panels)
+            self._main_splitter.setSizes([1120, 280])
+            self._main_splitter.setCollapsible(
+                0, False
+            )  # Don't allow collapsing drawing area
 
         # Create main layout
         layout = QHBoxLayout(self._central_widget)
@@ -306,29 +515,28 @@ class CADMainWindow(QMainWindow):
     def _setup_status_bar(self):
         """Setup status bar with coordinate display."""
         status_bar = self.statusBar()
+        # One shared rule for all status bar labels instead of per-label sheets
+        status_bar.setStyleSheet("QStatusBar QLabel { padding: 2px; }")
 
-        # Coordinate display
-        self._coord_label = QLabel("X: 0.0000  Y: 0.0000")
-        self._coord_label.setMinimumWidth(150)
-        self._coord_label.setStyleSheet("QLabel { padding: 2px; }")
-
-        # Zoom display
-        self._zoom_label = QLabel("Zoom: 100%")
-        self._zoom_label.setMinimumWidth(80)
-        self._zoom_label.setStyleSheet("QLabel { padding: 2px; }")
-
-        # Mode display
-        self._mode_label = QLabel("Select")
-        self._mode_label.setMinimumWidth(80)
-        self._mode_label.setStyleSheet("QLabel { padding: 2px; }")
+        # Message display; a plain label avoids showMessage() temporarily
+        # hiding the permanent widgets and relaying out the status bar
+        status_bar.addWidget(self._msg_label, 1)
 
-        # Add permanent widgets to status bar
+        # Add mode, zoom and coordinate displays as permanent widgets
         status_bar.addPermanentWidget(self._mode_label)
         status_bar.addPermanentWidget(self._zoom_label)
         status_bar.addPermanentWidget(self._coord_label)
 
         # Set initial message
-        status_bar.showMessage("Ready", 2000)
+        self._show_status_message("Ready", 2000)
+
+    def _show_status_message(self, message: str, timeout: int = 0):
+        """Show a status bar message, cleared after ``timeout`` ms if given."""
+        self._msg_label.setText(message)
+        if timeout:
+            self._msg_timer.start(timeout)
+        else:
+            self._msg_timer.stop()
 
     def _setup_tool_system(self):
         """Setup the tool management system."""
@@ -411,65 +619,48 @@ class CADMainWindow(QMainWindow):
                     self._selection_manager,
                 )
                 self._tool_manager.register_tool(tool_name, tool_instance)
-                logger.debug(f"Registered tool: {tool_name}")
+                logger.debug("Registered tool: %s", tool_name)
             except Exception as e:
                 logger.error(f"Failed to register tool {tool_name}: {e}")
 
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts."""
-        # File shortcuts
-        self._create_shortcut("Ctrl+N", self._new_document)
-        self._create_shortcut("Ctrl+O", self._open_document)
-        self._create_shortcut("Ctrl+S", self._save_document)
-        self._create_shortcut("Ctrl+Shift+S", self._save_document_as)
-        self._create_shortcut("Ctrl+Q", self.close)
-
-        # Edit shortcuts
-        self._create_shortcut("Ctrl+Z", self._undo)
-        self._create_shortcut("Ctrl+Y", self._redo)
-        self._create_shortcut("Ctrl+Shift+Z", self._redo)
-
-        # View shortcuts
-        self._create_shortcut("Ctrl+=", self._zoom_in)
-        self._create_shortcut("Ctrl+-", self._zoom_out)
-        self._create_shortcut("Ctrl+0", self._zoom_fit)
-
-        # Tool shortcuts
-        self._create_shortcut("Escape", self._select_tool)
-        self._create_shortcut("L", self._line_tool)
-        self._create_shortcut("C", self._circle_tool)
-        self._create_shortcut("R", self._rectangle_tool)
-
-        # Advanced tool shortcuts
-        self._create_shortcut("M", self._move_tool)
-        self._create_shortcut("CP", self._copy_tool)
-        self._create_shortcut("RO", self._rotate_tool)
-        self._create_shortcut("SC", self._scale_tool)
-        self._create_shortcut("MI", self._mirror_tool)
-        self._create_shortcut("TR", self._trim_tool)
-        self._create_shortcut("EX", self._extend_tool)
-        self._create_shortcut("O", self._offset_tool)
-        self._create_shortcut("F", self._fillet_tool)
-        self._create_shortcut("CH", self._chamfer_tool)
+        for key_sequence, action in self._SHORTCUT_SPEC:
+            # Keys already bound by a menu action would otherwise be ambiguous
+            if _key_sequence(key_sequence).toString() in self._menu_key_sequences:
+                continue
+            self._create_shortcut(
+                key_sequence, partial(self._handle_action, action)
+            )
 
     def _create_shortcut(self, key_sequence: str, slot):
         """Create and connect a keyboard shortcut."""
-        action = QAction(self)
-        action.setShortcut(QKeySequence(key_sequence))
-        action.triggered.connect(slot)
-        self.addAction(action)
+        shortcut = QShortcut(_key_sequence(key_sequence), self)
+        shortcut.setContext(Qt.ShortcutContext.WindowShortcut)
+        shortcut.activated.connect(slot)
+        self._shortcuts.append(shortcut)
 
     def _setup_connections(self):
-        """Setup signal connections."""
-        # Connect CAD application signals
-        self.cad_app.document_opened.connect(self._on_document_opened)
-        self.cad_app.document_closed.connect(self._on_document_closed)
-        self.cad_app.current_document_changed.connect(self._on_current_document_changed)
+        """Setup signal connections.
+
+        Safe to call again (e.g. after replacing the drawing area): unique
+        connections keep each slot connected at most once per signal.
+        """
+        unique = Qt.ConnectionType.UniqueConnection
+
+        # Connect CAD application signals once
+        if not self._connections_established:
+            self._connections_established = True
+            self.cad_app.document_opened.connect(self._on_document_opened, unique)
+            self.cad_app.document_closed.connect(self._on_document_closed, unique)
+            self.cad_app.current_document_changed.connect(
+                self._on_current_document_changed, unique
+            )
 
         # Connect drawing area signals
         if self._drawing_area:
-            self._drawing_area.mouse_moved.connect(self._update_coordinates)
-            self._drawing_area.zoom_changed.connect(self._update_zoom)
+            self._drawing_area.mouse_moved.connect(self._update_coordinates, unique)
+            self._drawing_area.zoom_changed.connect(self._update_zoom, unique)
 
     def _restore_window_state(self):
         """Restore window state from settings."""
@@ -495,13 +686,14 @@ class CADMainWindow(QMainWindow):
     def _save_window_state(self):
         """Save window state to settings."""
         try:
-            self.cad_app.set_setting("window_geometry", self.saveGeometry())
-            self.cad_app.set_setting("window_state", self.saveState())
+            with self.cad_app.batch_settings():
+                self.cad_app.set_setting("window_geometry", self.saveGeometry())
+                self.cad_app.set_setting("window_state", self.saveState())
 
-            if self._main_splitter:
-                self.cad_app.set_setting(
-                    "splitter_state", self._main_splitter.saveState()
-                )
+                if self._main_splitter:
+                    self.cad_app.set_setting(
+                        "splitter_state", self._main_splitter.saveState()
+                    )
 
         except Exception as e:
             logger.warning(f"Failed to save window state: {e}")
@@ -519,6 +711,18 @@ class CADMainWindow(QMainWindow):
             self.move(x, y)
 
     # Event handlers
+    def showEvent(self, event):
+        """Restore saved window state once, right before the first paint.
+
+        Deferring this from ``__init__`` lets the initial layout pass run
+        with the restored geometry instead of laying out twice.
+        """
+        if not self._window_state_restored:
+            self._window_state_restored = True
+            self._restore_window_state()
+
+        super().showEvent(event)
+
     def closeEvent(self, event):
         """Handle window close event."""
         try:
@@ -555,45 +759,29 @@ class CADMainWindow(QMainWindow):
             event.accept()  # Force close
 
     # Action handlers
-    def _handle_action(self, action_name: str):
-        """Handle ribbon action."""
-        logger.debug(f"Ribbon action triggered: {action_name}")
-
-        # Map ribbon actions to methods
-        action_map = {
-            "new": self._new_document,
-            "open": self._open_document,
-            "save": self._save_document,
-            "save_as": self._save_document_as,
-            "undo": self._undo,
-            "redo": self._redo,
-            "line": self._line_tool,
-            "circle": self._circle_tool,
-            "rectangle": self._rectangle_tool,
-            "zoom_in": self._zoom_in,
-            "zoom_out": self._zoom_out,
-            "zoom_fit": self._zoom_fit,
-            # Advanced modification tools
-            "move": self._move_tool,
-            "copy": self._copy_tool,
-            "rotate": self._rotate_tool,
-            "scale": self._scale_tool,
-            "mirror": self._mirror_tool,
-            "trim": self._trim_tool,
-            "extend": self._extend_tool,
-            "offset": self._offset_tool,
-            "fillet": self._fillet_tool,
-            "chamfer": self._chamfer_tool,
-            # Block tools
-            "block_create": self._block_create_tool,
-            "block_insert": self._block_insert_tool,
-        }
+    def _build_action_handlers(self) -> tuple:
+        """Resolve the handler for every ActionId, indexed by action code."""
+        handlers = []
+        for action in ActionId:
+            if action in self._TOOL_MODES:
+                handlers.append(partial(self._activate_named_tool, action))
+            elif action in self._ACTION_TABLE:
+                handlers.append(getattr(self, self._ACTION_TABLE[action]))
+            else:
+                handlers.append(None)
+        return tuple(handlers)
+
+    @Slot(int)
+    def _handle_action(self, action: int):
+        """Handle an action from the ribbon or a keyboard shortcut."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Action triggered: %s", ActionId(action).name)
 
-        handler = action_map.get(action_name)
+        handler = self._action_handlers[action]
         if handler:
             handler()
         else:
-            logger.warning(f"No handler for action: {action_name}")
+            logger.warning(f"No handler for action: {ActionId(action).name}")
 
     def _new_document(self):
         """Create a new document."""
@@ -626,7 +814,9 @@ class CADMainWindow(QMainWindow):
         """Export document to specified format with default options."""
         try:
             # Get current document ID
-            document_id = getattr(self.cad_app, 'current_document_id', 'default_doc')
+            document_id = (
+                self.cad_app.current_document_id or self.cad_app.DEFAULT_DOCUMENT_ID
+            )
             
             # Show file dialog
             format_upper = format_type.upper()
@@ -658,10 +848,10 @@ class CADMainWindow(QMainWindow):
     def _export_with_options(self):
         """Show export options dialog."""
         try:
-            from qt_client.ui.dialogs.export_dialog import ExportOptionsDialog
-            
             # Get current document ID
-            document_id = getattr(self.cad_app, 'current_document_id', 'default_doc')
+            document_id = (
+                self.cad_app.current_document_id or self.cad_app.DEFAULT_DOCUMENT_ID
+            )
             
             # Show export dialog
             dialog = ExportOptionsDialog(self.cad_app.api_client, document_id, self)
@@ -676,7 +866,9 @@ class CADMainWindow(QMainWindow):
         """Handle export request from export dialog."""
         try:
             # Get current document ID
-            document_id = getattr(self.cad_app, 'current_document_id', 'default_doc')
+            document_id = (
+                self.cad_app.current_document_id or self.cad_app.DEFAULT_DOCUMENT_ID
+            )
             
             # Perform export
             asyncio.create_task(self._perform_export(document_id, file_path, format_type, options))
@@ -693,7 +885,7 @@ class CADMainWindow(QMainWindow):
                 return
                 
             # Show progress
-            self.statusBar().showMessage(f"Exporting to {format_type.upper()}...")
+            self._show_status_message(f"Exporting to {format_type.upper()}...")
             
             # Call export API
             response = await self.cad_app.api_client.export_document(
@@ -709,17 +901,34 @@ class CADMainWindow(QMainWindow):
                 if file_size > 0:
                     success_msg += f" ({file_size} bytes)"
                     
-                self.statusBar().showMessage(success_msg, 3000)
-                QMessageBox.information(self, "Export Complete", success_msg)
+                self._show_status_message(success_msg, 3000)
+                self._show_export_message(
+                    QMessageBox.Icon.Information, "Export Complete", success_msg
+                )
             else:
                 error_msg = response.get("error_message", "Unknown export error")
-                self.statusBar().showMessage("Export failed", 3000)
-                QMessageBox.critical(self, "Export Error", f"Export failed: {error_msg}")
+                self._show_status_message("Export failed", 3000)
+                self._show_export_message(
+                    QMessageBox.Icon.Critical, "Export Error", f"Export failed: {error_msg}"
+                )
                 
         except Exception as e:
             logger.error(f"Error performing export: {e}")
-            self.statusBar().showMessage("Export failed", 3000)
-            QMessageBox.critical(self, "Export Error", f"Export failed: {str(e)}")
+            self._show_status_message("Export failed", 3000)
+            self._show_export_message(
+                QMessageBox.Icon.Critical, "Export Error", f"Export failed: {str(e)}"
+            )
+
+    def _show_export_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show an export result in a message box reused across exports."""
+        if self._export_msgbox is None:
+            self._export_msgbox = QMessageBox(self)
+            self._export_msgbox.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        self._export_msgbox.setIcon(icon)
+        self._export_msgbox.setWindowTitle(title)
+        self._export_msgbox.setText(text)
+        self._export_msgbox.exec()
 
     def _undo(self):
         """Undo last action."""
@@ -731,29 +940,17 @@ class CADMainWindow(QMainWindow):
         logger.debug("Redo action triggered")
         # TODO: Implement redo functionality
 
-    def _select_tool(self):
-        """Activate select tool."""
-        logger.debug("Select tool activated")
-        if self._mode_label:
-            self._mode_label.setText("Select")
-
-    def _line_tool(self):
-        """Activate line tool."""
-        logger.debug("Line tool activated")
-        if self._mode_label:
-            self._mode_label.setText("Line")
-
-    def _circle_tool(self):
-        """Activate circle tool."""
-        logger.debug("Circle tool activated")
-        if self._mode_label:
-            self._mode_label.setText("Circle")
-
-    def _rectangle_tool(self):
-        """Activate rectangle tool."""
-        logger.debug("Rectangle tool activated")
-        if self._mode_label:
-            self._mode_label.setText("Rectangle")
+    @Slot(int)
+    def _activate_named_tool(self, action: int):
+        """Activate the tool for an action in ``_TOOL_MODES`` and show its mode."""
+        tool_name, mode_text = self._TOOL_MODES[action]
+        logger.debug("%s tool activated", mode_text)
+
+        tool_manager = self._tool_manager
+        if tool_name and tool_manager:
+            tool_manager.activate_tool(tool_name)
+
+        self._mode_label.setText(mode_text)
 
     def _zoom_in(self):
         """Zoom in."""
@@ -781,127 +978,81 @@ class CADMainWindow(QMainWindow):
             "<p>Copyright © 2023 CAD-PY Development Team</p>",
         )
 
-    # Advanced modification tool handlers
-    def _move_tool(self):
-        """Activate move tool."""
-        logger.debug("Move tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("move")
-        if self._mode_label:
-            self._mode_label.setText("Move")
-
-    def _copy_tool(self):
-        """Activate copy tool."""
-        logger.debug("Copy tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("copy")
-        if self._mode_label:
-            self._mode_label.setText("Copy")
-
-    def _rotate_tool(self):
-        """Activate rotate tool."""
-        logger.debug("Rotate tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("rotate")
-        if self._mode_label:
-            self._mode_label.setText("Rotate")
-
-    def _scale_tool(self):
-        """Activate scale tool."""
-        logger.debug("Scale tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("scale")
-        if self._mode_label:
-            self._mode_label.setText("Scale")
-
-    def _mirror_tool(self):
-        """Activate mirror tool."""
-        logger.debug("Mirror tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("mirror")
-        if self._mode_label:
-            self._mode_label.setText("Mirror")
-
-    def _trim_tool(self):
-        """Activate trim tool."""
-        logger.debug("Trim tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("trim")
-        if self._mode_label:
-            self._mode_label.setText("Trim")
-
-    def _extend_tool(self):
-        """Activate extend tool."""
-        logger.debug("Extend tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("extend")
-        if self._mode_label:
-            self._mode_label.setText("Extend")
-
-    def _offset_tool(self):
-        """Activate offset tool."""
-        logger.debug("Offset tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("offset")
-        if self._mode_label:
-            self._mode_label.setText("Offset")
-
-    def _fillet_tool(self):
-        """Activate fillet tool."""
-        logger.debug("Fillet tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("fillet")
-        if self._mode_label:
-            self._mode_label.setText("Fillet")
-
-    def _chamfer_tool(self):
-        """Activate chamfer tool."""
-        logger.debug("Chamfer tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("chamfer")
-        if self._mode_label:
-            self._mode_label.setText("Chamfer")
-
-    def _block_create_tool(self):
-        """Activate block creation tool."""
-        logger.debug("Block creation tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("block_create")
-        if self._mode_label:
-            self._mode_label.setText("Create Block")
-
-    def _block_insert_tool(self):
-        """Activate block insertion tool."""
-        logger.debug("Block insertion tool activated")
-        if self._tool_manager:
-            self._tool_manager.activate_tool("block_insert")
-        if self._mode_label:
-            self._mode_label.setText("Insert Block")
-
     # Signal handlers
+    @Slot(str)
     def _on_document_opened(self, document_id: str):
         """Handle document opened."""
-        self.setWindowTitle(f"PyCAD 2D Professional - {document_id}")
-        self.statusBar().showMessage(f"Opened document: {document_id}", 3000)
+        self._set_title(f"PyCAD 2D Professional - {document_id}")
+        self._show_status_message(f"Opened document: {document_id}", 3000)
 
+    @Slot(str)
     def _on_document_closed(self, document_id: str):
         """Handle document closed."""
-        self.setWindowTitle("PyCAD 2D Professional")
-        self.statusBar().showMessage(f"Closed document: {document_id}", 3000)
+        self._set_title("PyCAD 2D Professional")
+        self._show_status_message(f"Closed document: {document_id}", 3000)
 
+    @Slot(str)
     def _on_current_document_changed(self, document_id: str):
         """Handle current document changed."""
         if document_id:
-            self.setWindowTitle(f"PyCAD 2D Professional - {document_id}")
+            self._set_title(f"PyCAD 2D Professional - {document_id}")
         else:
-            self.setWindowTitle("PyCAD 2D Professional")
-
-    def _update_coordinates(self, world_pos: QPoint):
-        """Update coordinate display."""
-        if self._coord_label:
-            self._coord_label.setText(f"X: {world_pos.x():.4f}  Y: {world_pos.y():.4f}")
+            self._set_title("PyCAD 2D Professional")
+
+    def _set_title(self, title: str):
+        """Set the window title, skipping the update if it is unchanged."""
+        if title != self._current_title:
+            self._current_title = title
+            self.setWindowTitle(title)
+
+    @Slot(QPointF)
+    def _update_coordinates(self, world_pos: QPointF):
+        """Queue a coordinate display update (flushed at most once per frame)."""
+        self._pending_coord = (world_pos.x(), world_pos.y())
+        timer = self._coord_timer
+        if not timer.isActive():
+            timer.start()
+
+    @Slot()
+    def _flush_coord(self):
+        """Write the latest queued coordinates to the status bar."""
+        pending = self._pending_coord
+        if pending is None:
+            return
+
+        self._pending_coord = None
+        x, y = pending
+
+        # Skip the repaint when the displayed digits would not change
+        xi = round(x * COORD_QUANTUM)
+        yi = round(y * COORD_QUANTUM)
+        if (xi, yi) == self._last_coord:
+            return
+
+        self._last_coord = (xi, yi)
+        self._coord_label.setText(
+            format_coordinates(xi / COORD_QUANTUM, yi / COORD_QUANTUM)
+        )
 
+    @Slot(float)
     def _update_zoom(self, zoom_factor: float):
-        """Update zoom display."""
-        if self._zoom_label:
-            self._zoom_label.setText(f"Zoom: {zoom_factor * 100:.0f}%")
+        """Queue a zoom display update (flushed at most once per frame)."""
+        self._pending_zoom = zoom_factor
+        timer = self._zoom_timer
+        if not timer.isActive():
+            timer.start()
+
+    @Slot()
+    def _flush_zoom(self):
+        """Write the latest queued zoom factor to the status bar."""
+        pending = self._pending_zoom
+        if pending is None:
+            return
+
+        self._pending_zoom = None
+        zoom_percent = round(pending * 100)
+        if zoom_percent == self._last_zoom:
+            return
+
+        self._last_zoom = zoom_percent
+        self._zoom_label.setText(format_zoom(zoom_percent))
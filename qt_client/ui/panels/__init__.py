@@ -1,7 +1,32 @@
-"""UI panels for properties, layers, and other tools."""
+"""UI panels for properties, layers, and other tools.
 
-from .history_panel import HistoryPanel, HistoryToolbar
-from .layers_panel import LayersPanel
-from .properties_panel import PropertiesPanel
+Panel classes are imported lazily on first access so that importing this
+package does not pull in every panel's dependencies.
+"""
 
-__all__ = ["PropertiesPanel", "LayersPanel", "HistoryPanel", "HistoryToolbar"]
+import importlib
+
+# Exported name -> submodule defining it
+_PANEL_MODULES = {
+    "PropertiesPanel": "properties_panel",
+    "LayersPanel": "layers_panel",
+    "BlocksPanel": "blocks_panel",
+    "HistoryPanel": "history_panel",
+    "HistoryToolbar": "history_panel",
+}
+
+__all__ = list(_PANEL_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _PANEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
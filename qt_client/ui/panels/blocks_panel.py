@@ -2,9 +2,12 @@
 
 import asyncio
 import logging
+import re
+import time
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, QSignalBlocker, QTimer
 from PySide6.QtGui import QPixmap, QIcon
 from PySide6.QtWidgets import (
     QWidget,
@@ -32,6 +35,18 @@ from PySide6.QtWidgets import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _title(text: str) -> str:
+    """Title-case a block type; there are only a handful of distinct values."""
+    return text.title()
+
+
+def _wildcard_pattern(text: str) -> re.Pattern:
+    """Compile search text with ``*`` and ``?`` wildcards to a regex."""
+    escaped = re.escape(text).replace(r"\*", ".*").replace(r"\?", ".")
+    return re.compile(escaped, re.IGNORECASE)
+
+
 class BlocksPanel(QWidget):
     """Panel for managing blocks and block libraries."""
 
@@ -41,6 +56,14 @@ class BlocksPanel(QWidget):
     block_created = Signal(dict)  # block_data
     block_deleted = Signal(str)  # block_id
 
+    # Adaptive refresh polling: starts fast, backs off while nothing changes
+    REFRESH_MIN_INTERVAL_MS = 5000
+    REFRESH_MAX_INTERVAL_MS = 60000
+    # Loads faster than this don't flash a "Loading" status
+    LOADING_STATUS_THRESHOLD_S = 0.2
+    # Set once the missing asyncio event loop has been reported
+    _warned_no_event_loop = False
+
     def __init__(self, api_client, parent=None):
         super().__init__(parent)
         self.api_client = api_client
@@ -48,6 +71,16 @@ class BlocksPanel(QWidget):
         self.current_category: str = "All"
         self.blocks_data: Dict[str, Any] = {}
         self.libraries_data: Dict[str, Any] = {}
+        self._last_version: Optional[Any] = None
+        self._library_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._library_id_by_name: Dict[str, str] = {}
+        self._displayed_block_id: Optional[str] = None
+        self._load_task: Optional[asyncio.Task] = None
+        self._pending_load_force: Optional[bool] = None
+        self._load_seq = 0
+        self._polling_paused = False
+        self._last_status = "Ready"
+        self._last_load_duration: Optional[float] = None
 
         self.setWindowTitle("Blocks")
         self.setMinimumWidth(300)
@@ -55,12 +88,12 @@ class BlocksPanel(QWidget):
 
         self._setup_ui()
         self._setup_connections()
-        self._load_data()
+        self._run_async(self._load_data())
 
-        # Setup refresh timer
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self._load_data)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        # Setup refresh timer; it only runs while the panel is visible
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_MIN_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(lambda: self._run_async(self._load_data()))
 
         logger.debug("Blocks panel initialized")
 
@@ -109,6 +142,12 @@ class BlocksPanel(QWidget):
         self.search_edit.textChanged.connect(self._on_search_changed)
         search_layout.addWidget(self.search_edit)
 
+        # Debounce search input with a single reusable timer
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(500)
+        self._search_timer.timeout.connect(self._schedule_load)
+
         self.search_clear_btn = QPushButton("Clear")
         self.search_clear_btn.setMaximumWidth(50)
         self.search_clear_btn.clicked.connect(self._clear_search)
@@ -160,12 +199,29 @@ class BlocksPanel(QWidget):
         self.blocks_tree.setHeaderLabels(["Name", "Type", "Entities"])
         self.blocks_tree.setRootIsDecorated(False)
         self.blocks_tree.setAlternatingRowColors(True)
+        self.blocks_tree.setUniformRowHeights(True)
         self.blocks_tree.itemSelectionChanged.connect(self._on_block_selection_changed)
         self.blocks_tree.itemDoubleClicked.connect(self._on_block_double_clicked)
         self.blocks_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.blocks_tree.customContextMenuRequested.connect(self._show_block_context_menu)
         blocks_layout.addWidget(self.blocks_tree)
 
+        # Debounce selection changes, e.g. while arrowing through the list
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(80)
+        self._selection_timer.timeout.connect(self._apply_selection)
+
+        # Block type icons, looked up once and shared by every row
+        style = self.style()
+        self._icon_by_type = {
+            "static": style.standardIcon(style.StandardPixmap.SP_FileIcon),
+            "dynamic": style.standardIcon(style.StandardPixmap.SP_ComputerIcon),
+            "annotative": style.standardIcon(
+                style.StandardPixmap.SP_FileDialogDetailedView
+            ),
+        }
+
         main_splitter.addWidget(blocks_group)
 
         # Block details
@@ -204,7 +260,7 @@ class BlocksPanel(QWidget):
         layout.addWidget(main_splitter)
 
         # Status
-        self.status_label = QLabel("Ready")
+        self.status_label = QLabel(self._last_status)
         self.status_label.setStyleSheet("color: gray; font-size: 10px;")
         layout.addWidget(self.status_label)
 
@@ -214,109 +270,297 @@ class BlocksPanel(QWidget):
 
     async def _load_data(self):
         """Load blocks and libraries data."""
+        started = time.perf_counter()
         try:
-            self.status_label.setText("Loading blocks...")
-            
-            # Load libraries first
-            await self._load_libraries()
-            
-            # Load blocks
-            await self._load_blocks()
-            
-            self.status_label.setText("Ready")
-            
+            if (
+                self._last_load_duration is None
+                or self._last_load_duration >= self.LOADING_STATUS_THRESHOLD_S
+            ):
+                self._set_status("Loading blocks...")
+
+            if self.current_library_id is None:
+                # Blocks are fetched per library, so the first load picks one
+                await self._load_libraries()
+                await self._load_blocks(force=True, raise_errors=True)
+            else:
+                results = await asyncio.gather(
+                    self._load_libraries(),
+                    self._load_blocks(force=True, raise_errors=True),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        raise result
+
+            self._set_status("Ready")
+
         except Exception as e:
             logger.error(f"Error loading blocks data: {e}")
-            self.status_label.setText(f"Error: {str(e)}")
+            self._set_status(f"Error: {str(e)}")
+        finally:
+            self._last_load_duration = time.perf_counter() - started
+
+    def _set_status(self, text: str):
+        """Show a status message, skipping the repaint if it is unchanged."""
+        if text != self._last_status:
+            self._last_status = text
+            self.status_label.setText(text)
 
     async def _load_libraries(self):
         """Load block libraries."""
         # For now, just add a default library
         # In a real implementation, this would load from the API
         if not self.library_combo.count():
-            self.library_combo.addItem("Default Library")
+            # _load_data loads the blocks itself; don't trigger a second load
+            with QSignalBlocker(self.library_combo):
+                self.library_combo.addItem("Default Library")
+            self._library_id_by_name["Default Library"] = "default"
             self.current_library_id = "default"
 
-    async def _load_blocks(self):
-        """Load blocks from the API."""
+    async def _load_blocks(self, force: bool = False, raise_errors: bool = False):
+        """Load blocks from the API.
+
+        The whole library is fetched and cached; category and search filters
+        are applied locally, so only a library switch or ``force`` refetches.
+        Errors are logged, or raised to the caller with ``raise_errors``.
+        """
+        if not self.api_client:
+            return
+
         try:
-            if not self.api_client:
+            library_id = self.current_library_id
+            if not force and library_id in self._library_cache:
+                self._apply_filters_and_display()
                 return
 
+            # A newer fetch supersedes this one while it is awaiting
+            seq = self._load_seq = self._load_seq + 1
+
             # Prepare request
             request = {}
-            if self.current_library_id:
-                request["library_id"] = self.current_library_id
-            if self.current_category and self.current_category != "All":
-                request["category"] = self.current_category
-            
-            search_text = self.search_edit.text().strip()
-            if search_text:
-                request["search_query"] = search_text
+            if library_id:
+                request["library_id"] = library_id
+            if self._last_version is not None:
+                request["since_version"] = self._last_version
 
             # Call API
             response = await self.api_client.get_blocks(request)
+            if seq != self._load_seq:
+                return
+
             if response.get("success", False):
-                blocks_data = response.get("data", {}).get("blocks", [])
-                self._update_blocks_display(blocks_data)
+                data = response.get("data", {})
+                if data.get("not_modified", False):
+                    self._adjust_refresh_interval(changed=False)
+                    return
+
+                self._last_version = data.get("version")
+                blocks = data.get("blocks", [])
+                # Servers without version tokens resend the full list
+                if blocks == self._library_cache.get(library_id):
+                    self._adjust_refresh_interval(changed=False)
+                    return
+
+                self._library_cache[library_id] = blocks
+                self._adjust_refresh_interval(changed=True)
+                self._apply_filters_and_display()
             else:
                 error_msg = response.get("error_message", "Unknown error")
+                if raise_errors:
+                    raise RuntimeError(f"Failed to load blocks: {error_msg}")
                 logger.error(f"Failed to load blocks: {error_msg}")
 
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"Error loading blocks: {e}")
 
-    def _update_blocks_display(self, blocks_data: List[Dict[str, Any]]):
-        """Update the blocks tree display."""
-        self.blocks_tree.clear()
-        self.blocks_data.clear()
-
-        for block_data in blocks_data:
-            block_id = block_data["id"]
-            self.blocks_data[block_id] = block_data
-
-            # Create tree item
-            item = QTreeWidgetItem()
-            item.setText(0, block_data["name"])
-            item.setText(1, block_data.get("block_type", "static").title())
-            item.setText(2, str(block_data.get("entity_count", 0)))
-            item.setData(0, Qt.ItemDataRole.UserRole, block_id)
-
-            # Set icon based on block type
-            block_type = block_data.get("block_type", "static")
-            if block_type == "dynamic":
-                item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_ComputerIcon))
-            elif block_type == "annotative":
-                item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_FileDialogDetailedView))
+    def _apply_filters_and_display(self):
+        """Show the cached library blocks matching the category and search."""
+        blocks = self._library_cache.get(self.current_library_id, [])
+
+        category = self.current_category
+        if category and category != "All":
+            blocks = [b for b in blocks if b.get("category") == category]
+
+        search_text = self.search_edit.text().strip()
+        if search_text:
+            match = _wildcard_pattern(search_text).search
+            blocks = [
+                b
+                for b in blocks
+                if match(b.get("name", ""))
+                or match(b.get("description", ""))
+                or any(match(tag) for tag in b.get("tags", []))
+            ]
+
+        self._update_blocks_display(blocks)
+
+    def _invalidate_library_cache(self):
+        """Drop the cached blocks of the current library after a change."""
+        self._library_cache.pop(self.current_library_id, None)
+        self._last_version = None
+
+    def _schedule_load(self, force: bool = False):
+        """Load blocks, coalescing requests made while a load is running."""
+        if self._load_task and not self._load_task.done():
+            # The running load reruns once more when it finishes
+            self._pending_load_force = bool(self._pending_load_force) or force
+            return
+
+        self._load_task = self._run_async(self._run_scheduled_loads(force))
+
+    async def _run_scheduled_loads(self, force: bool):
+        """Run a load, then one more for each batch of requests made meanwhile."""
+        await self._load_blocks(force=force)
+        while self._pending_load_force is not None:
+            force, self._pending_load_force = self._pending_load_force, None
+            await self._load_blocks(force=force)
+
+    def _run_async(self, coro) -> Optional[asyncio.Task]:
+        """Schedule a coroutine on the running event loop, if there is one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Close it so Python doesn't warn about a never-awaited coroutine
+            coro.close()
+            if not BlocksPanel._warned_no_event_loop:
+                BlocksPanel._warned_no_event_loop = True
+                logger.warning(
+                    "No running asyncio event loop; BlocksPanel backend calls "
+                    "are skipped (first skipped: %s)",
+                    coro.__qualname__,
+                )
             else:
-                item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_FileIcon))
+                logger.debug("No running event loop; skipped %s", coro.__qualname__)
+            return None
 
-            self.blocks_tree.addTopLevelItem(item)
+        return loop.create_task(coro)
+
+    def _adjust_refresh_interval(self, changed: bool):
+        """Reset polling to the fastest rate on change, otherwise back off."""
+        if changed:
+            interval = self.REFRESH_MIN_INTERVAL_MS
+        else:
+            interval = min(
+                self.refresh_timer.interval() * 2, self.REFRESH_MAX_INTERVAL_MS
+            )
+
+        if interval != self.refresh_timer.interval():
+            self.refresh_timer.setInterval(interval)
+
+    def showEvent(self, event):
+        """Resume refresh polling while the panel is visible."""
+        super().showEvent(event)
+        # Without an API client every poll would be a no-op
+        if self.api_client and not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+            # Catch up on changes missed while hidden; the first show is
+            # already covered by the load started in __init__
+            if self._polling_paused:
+                self._polling_paused = False
+                self._run_async(self._load_data())
+
+    def hideEvent(self, event):
+        """Pause refresh polling while the panel is hidden."""
+        super().hideEvent(event)
+        if self.refresh_timer.isActive():
+            self.refresh_timer.stop()
+            self._polling_paused = True
+
+    def _update_blocks_display(self, blocks_data: List[Dict[str, Any]]):
+        """Update the blocks tree display.
+
+        Items of blocks that are still listed are reused and only their
+        changed columns are updated; new blocks get new items.
+        """
+        displayed_data = self.blocks_data.get(self._displayed_block_id)
+        self.blocks_data = {b["id"]: b for b in blocks_data}
+
+        # Precompute each row's id, column texts and type in one pass
+        rows = [
+            (
+                b["id"],
+                [
+                    b["name"],
+                    _title(b.get("block_type", "static")),
+                    str(b.get("entity_count", 0)),
+                ],
+                b.get("block_type", "static"),
+            )
+            for b in blocks_data
+        ]
+
+        root = self.blocks_tree.invisibleRootItem()
+        current_items = [root.child(i) for i in range(root.childCount())]
+        old_items = {
+            item.data(0, Qt.ItemDataRole.UserRole): item for item in current_items
+        }
+        selected_id = self.get_selected_block_id()
+
+        # Apply changes in one batch so the tree relayouts and repaints once
+        self.blocks_tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.blocks_tree):
+                items = []
+                default_icon = self._icon_by_type["static"]
+                for block_id, texts, block_type in rows:
+                    icon = self._icon_by_type.get(block_type, default_icon)
+
+                    item = old_items.get(block_id)
+                    if item is None:
+                        item = QTreeWidgetItem(texts)
+                        item.setData(0, Qt.ItemDataRole.UserRole, block_id)
+                        item.setIcon(0, icon)
+                    else:
+                        for column, text in enumerate(texts):
+                            if item.text(column) != text:
+                                item.setText(column, text)
+                        if item.icon(0).cacheKey() != icon.cacheKey():
+                            item.setIcon(0, icon)
+
+                    items.append(item)
+
+                # Re-seat rows only when the listed blocks or their order changed
+                if items != current_items:
+                    root.takeChildren()
+                    self.blocks_tree.addTopLevelItems(items)
+
+                    selected = old_items.get(selected_id)
+                    if selected is not None and selected_id in self.blocks_data:
+                        selected.setSelected(True)
+        finally:
+            self.blocks_tree.setUpdatesEnabled(True)
+
+        # Redraw the details if the displayed block itself changed
+        if self.blocks_data.get(self._displayed_block_id) != displayed_data:
+            self._displayed_block_id = None
+
+        # One explicit update for any selection change made while blocked
+        self._on_block_selection_changed()
 
         # Update status
         count = len(blocks_data)
-        self.status_label.setText(f"{count} block{'s' if count != 1 else ''} found")
+        self._set_status(f"{count} block{'s' if count != 1 else ''} found")
 
     def _on_library_changed(self, library_name: str):
         """Handle library selection change."""
-        self.current_library_id = library_name.lower().replace(" ", "_")
-        asyncio.create_task(self._load_blocks())
+        self.current_library_id = self._library_id_by_name.get(
+            library_name
+        ) or library_name.lower().replace(" ", "_")
+        # The version token belonged to the previous library
+        self._last_version = None
+        self._schedule_load()
 
     def _on_category_changed(self, category: str):
         """Handle category selection change."""
         self.current_category = category
-        asyncio.create_task(self._load_blocks())
+        self._schedule_load()
 
     def _on_search_changed(self, text: str):
         """Handle search text change."""
-        # Debounce search
-        if hasattr(self, "_search_timer"):
-            self._search_timer.stop()
-        
-        self._search_timer = QTimer()
-        self._search_timer.setSingleShot(True)
-        self._search_timer.timeout.connect(lambda: asyncio.create_task(self._load_blocks()))
-        self._search_timer.start(500)  # 500ms delay
+        # Restart the debounce countdown
+        self._search_timer.start()
 
     def _clear_search(self):
         """Clear search text."""
@@ -324,10 +568,16 @@ class BlocksPanel(QWidget):
 
     def _on_block_selection_changed(self):
         """Handle block selection change."""
+        # Restart the debounce countdown so only the final selection applies
+        self._selection_timer.start()
+
+    def _apply_selection(self):
+        """Update details and buttons for the current selection."""
         selected_items = self.blocks_tree.selectedItems()
         if selected_items:
             item = selected_items[0]
             block_id = item.data(0, Qt.ItemDataRole.UserRole)
+            selection_changed = block_id != self._displayed_block_id
             self._update_block_details(block_id)
             
             # Enable/disable buttons
@@ -336,7 +586,8 @@ class BlocksPanel(QWidget):
             self.delete_block_btn.setEnabled(True)
             
             # Emit signal
-            self.block_selected.emit(block_id)
+            if selection_changed:
+                self.block_selected.emit(block_id)
         else:
             self._clear_block_details()
             
@@ -351,6 +602,9 @@ class BlocksPanel(QWidget):
 
     def _update_block_details(self, block_id: str):
         """Update block details display."""
+        if block_id == self._displayed_block_id:
+            return
+
         if block_id not in self.blocks_data:
             self._clear_block_details()
             return
@@ -368,6 +622,7 @@ class BlocksPanel(QWidget):
 
         # TODO: Load and display block preview image
         self.block_preview.setText("Preview not available")
+        self._displayed_block_id = block_id
 
     def _clear_block_details(self):
         """Clear block details display."""
@@ -376,6 +631,7 @@ class BlocksPanel(QWidget):
         self.block_stats_label.setText("Entities: - | Attributes: -")
         self.block_author_label.setText("Author: -")
         self.block_preview.setText("No preview available")
+        self._displayed_block_id = None
 
     def _show_block_context_menu(self, position):
         """Show context menu for block."""
@@ -474,7 +730,7 @@ class BlocksPanel(QWidget):
         )
         
         if ok and new_name.strip() and new_name.strip() != current_name:
-            asyncio.create_task(self._update_block_name(block_id, new_name.strip()))
+            self._run_async(self._update_block_name(block_id, new_name.strip()))
 
     async def _update_block_name(self, block_id: str, new_name: str):
         """Update block name via API."""
@@ -489,6 +745,7 @@ class BlocksPanel(QWidget):
             
             response = await self.api_client.update_block(request)
             if response.get("success", False):
+                self._invalidate_library_cache()
                 await self._load_blocks()  # Refresh
                 QMessageBox.information(self, "Success", f"Block renamed to '{new_name}'")
             else:
@@ -529,7 +786,7 @@ class BlocksPanel(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            asyncio.create_task(self._delete_block_api(block_id))
+            self._run_async(self._delete_block_api(block_id))
 
     async def _delete_block_api(self, block_id: str):
         """Delete block via API."""
@@ -541,6 +798,7 @@ class BlocksPanel(QWidget):
             
             response = await self.api_client.delete_block(request)
             if response.get("success", False):
+                self._invalidate_library_cache()
                 await self._load_blocks()  # Refresh
                 self.block_deleted.emit(block_id)
                 QMessageBox.information(self, "Success", "Block deleted successfully")
@@ -558,7 +816,7 @@ class BlocksPanel(QWidget):
 
     def refresh(self):
         """Refresh the blocks display."""
-        asyncio.create_task(self._load_blocks())
+        self._schedule_load(force=True)
 
     def get_selected_block_id(self) -> Optional[str]:
         """Get the currently selected block ID."""
@@ -5,11 +5,22 @@ This panel provides a visual interface for viewing command history,
 performing undo/redo operations, and managing command memory usage.
 """
 
+from functools import lru_cache, partial
 from typing import Dict, List, Optional
 
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction, QBrush, QIcon, QPalette
 from PySide6.QtWidgets import (
+    QCheckBox,
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
@@ -17,8 +28,8 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QPushButton,
     QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyledItemDelegate,
+    QTableView,
     QToolButton,
     QVBoxLayout,
     QWidget,
@@ -27,6 +38,369 @@ from PySide6.QtWidgets import (
 from ...core.command_manager import CommandManager
 
 
+@lru_cache(maxsize=32)
+def _title(text: str) -> str:
+    """Title-case a command type or state; both are small fixed sets."""
+    return text.title()
+
+
+class CommandHistoryModel(QAbstractTableModel):
+    """
+    Table model serving command history snapshots to a view.
+
+    Cell text and colors are produced on demand in data(), so only rows
+    the view actually paints are ever formatted.
+    """
+
+    HEADERS = ("Command", "Type", "State", "Time")
+
+    # Rows shown by default; older commands are only listed on request
+    DEFAULT_ROW_LIMIT = 500
+
+    # Brushes are built once and shared by every cell
+    _STATE_COLORS = {
+        "completed": Qt.darkGreen,
+        "failed": Qt.red,
+        "executing": Qt.blue,
+        "undoing": Qt.magenta,
+        "undone": Qt.gray,
+        "pending": Qt.black,
+    }
+    _STATE_BRUSHES = {state: QBrush(color) for state, color in _STATE_COLORS.items()}
+    _DEFAULT_BRUSH = QBrush(Qt.black)
+    _GRAY_BRUSH = QBrush(Qt.gray)
+
+    # Cells are colored by HistoryDelegate from a small-int bucket served
+    # through Qt.UserRole, indexing BUCKET_BRUSHES
+    _STATE_BUCKETS = {state: bucket for bucket, state in enumerate(_STATE_COLORS)}
+    DEFAULT_BUCKET = len(_STATE_COLORS)
+    REDO_BUCKET = DEFAULT_BUCKET + 1
+    BUCKET_BRUSHES = (*_STATE_BRUSHES.values(), _DEFAULT_BRUSH, _GRAY_BRUSH)
+
+    # Positions of the lists in a history columns tuple; the first four
+    # line up with the table columns
+    _DESCRIPTIONS, _TYPES, _STATES, _EXEC_TIMES, _REDO_FLAGS, _TIMESTAMPS = range(6)
+
+    def __init__(self, parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            parent: Qt parent object
+        """
+        super().__init__(parent)
+        self._source: tuple = tuple([] for _ in range(6))
+        self._columns: tuple = self._source
+        self._time_texts: List[Optional[str]] = []
+        self._row_limit: Optional[int] = self.DEFAULT_ROW_LIMIT
+
+    def set_history(self, columns: tuple):
+        """
+        Replace the displayed history with a new snapshot.
+
+        Rows are matched to the previous snapshot by command, so only the
+        inserted, removed and changed rows are signalled to the view.
+
+        Args:
+            columns: History column lists from get_history_columns(),
+                most recent first
+        """
+        if columns is self._source:
+            return
+
+        self._source = columns
+        self._show_rows(self._windowed(columns))
+
+    def set_row_limit(self, limit: Optional[int]):
+        """
+        Limit the table to the most recent commands.
+
+        Args:
+            limit: Maximum number of rows to show, or None to show all
+        """
+        if limit != self._row_limit:
+            self._row_limit = limit
+            self._show_rows(self._windowed(self._source))
+
+    def _windowed(self, columns: tuple) -> tuple:
+        """Cut the history down to the current row limit."""
+        if self._row_limit is None or len(columns[0]) <= self._row_limit:
+            return columns
+        return tuple(column[: self._row_limit] for column in columns)
+
+    def _show_rows(self, columns: tuple):
+        """Replace the model rows, signalling only what changed."""
+        old = self._columns
+
+        # Rows are identified by command timestamp and description
+        old_keys = list(zip(old[self._TIMESTAMPS], old[self._DESCRIPTIONS]))
+        new_keys = list(zip(columns[self._TIMESTAMPS], columns[self._DESCRIPTIONS]))
+        old_count = len(old_keys)
+        new_count = len(new_keys)
+
+        # Rows shared at the start and end of both snapshots
+        limit = min(old_count, new_count)
+        prefix = 0
+        while prefix < limit and old_keys[prefix] == new_keys[prefix]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < limit - prefix and old_keys[-1 - suffix] == new_keys[-1 - suffix]
+        ):
+            suffix += 1
+
+        # The differing middle section is updated in place where it
+        # overlaps and shrunk or grown by the remainder
+        old_mid = old_count - prefix - suffix
+        new_mid = new_count - prefix - suffix
+        mid_end = prefix + min(old_mid, new_mid)
+        if old_mid > new_mid:
+            self.beginRemoveRows(QModelIndex(), mid_end, prefix + old_mid - 1)
+            self._set_columns(
+                tuple(column[:mid_end] + column[prefix + old_mid :] for column in old)
+            )
+            self.endRemoveRows()
+        elif new_mid > old_mid:
+            self.beginInsertRows(QModelIndex(), mid_end, prefix + new_mid - 1)
+            self._set_columns(
+                tuple(
+                    old_column[:mid_end]
+                    + new_column[mid_end : prefix + new_mid]
+                    + old_column[mid_end:]
+                    for old_column, new_column in zip(old, columns)
+                )
+            )
+            self.endInsertRows()
+
+        # Matched rows may still have changed state, stack or time
+        old_rows = list(
+            zip(old[self._STATES], old[self._REDO_FLAGS], old[self._EXEC_TIMES])
+        )
+        new_rows = list(
+            zip(
+                columns[self._STATES],
+                columns[self._REDO_FLAGS],
+                columns[self._EXEC_TIMES],
+            )
+        )
+        offset = old_count - new_count
+        changed = list(range(prefix, mid_end))
+        changed += [row for row in range(prefix) if old_rows[row] != new_rows[row]]
+        changed += [
+            row
+            for row in range(new_count - suffix, new_count)
+            if old_rows[row + offset] != new_rows[row]
+        ]
+
+        self._set_columns(columns)
+        if changed:
+            self.dataChanged.emit(
+                self.index(min(changed), 0),
+                self.index(max(changed), self.columnCount() - 1),
+            )
+
+    def _set_columns(self, columns: tuple):
+        """Store the displayed columns and reset the formatted time cache."""
+        self._columns = columns
+        self._time_texts = [None] * len(columns[0])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._time_texts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self._EXEC_TIMES:
+                return self._time_text(row)
+            value = self._columns[column][row]
+            return value if column == self._DESCRIPTIONS else _title(value)
+
+        if role == Qt.UserRole:
+            # Commands on the redo stack are grayed out
+            if self._columns[self._REDO_FLAGS][row]:
+                return self.REDO_BUCKET
+            if column == self._STATES:
+                return self._STATE_BUCKETS.get(
+                    self._columns[self._STATES][row], self.DEFAULT_BUCKET
+                )
+
+        return None
+
+    def _time_text(self, row: int) -> str:
+        """Format a row's execution time once per snapshot."""
+        time_text = self._time_texts[row]
+        if time_text is None:
+            exec_time = self._columns[self._EXEC_TIMES][row]
+            time_text = "N/A" if exec_time is None else f"{exec_time:.3f}s"
+            self._time_texts[row] = time_text
+        return time_text
+
+    @classmethod
+    def state_brush(cls, state: str) -> QBrush:
+        """Get the cached brush for command state display."""
+        return cls._STATE_BRUSHES.get(state, cls._DEFAULT_BRUSH)
+
+
+class HistoryDelegate(QStyledItemDelegate):
+    """
+    Item delegate coloring history cells by their model color bucket.
+    """
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+
+        bucket = index.data(Qt.UserRole)
+        if bucket is not None:
+            palette = option.palette
+            palette.setBrush(QPalette.Text, CommandHistoryModel.BUCKET_BRUSHES[bucket])
+            option.palette = palette
+
+
+# Memory progress bar chunk styles by usage bucket
+MEMORY_BAR_STYLES = {
+    "red": "QProgressBar::chunk { background-color: #ff4444; }",
+    "amber": "QProgressBar::chunk { background-color: #ffaa00; }",
+    "green": "QProgressBar::chunk { background-color: #44ff44; }",
+}
+
+
+class HistorySnapshotFetcher(QObject):
+    """
+    Builds command history snapshots on the global thread pool.
+
+    Results are delivered through the finished signal, which is queued to
+    the receiver's thread.
+    """
+
+    finished = Signal(object)  # history columns snapshot
+
+    def fetch(self, undo_commands: List, redo_commands: List):
+        """
+        Start building a history snapshot in the background.
+
+        Args:
+            undo_commands: Copy of the undo stack, oldest first
+            redo_commands: Copy of the redo stack, oldest first
+        """
+        QThreadPool.globalInstance().start(
+            partial(self._build, undo_commands, redo_commands)
+        )
+
+    def _build(self, undo_commands: List, redo_commands: List):
+        """Build the snapshot; runs on a worker thread."""
+        self.finished.emit(
+            CommandManager.build_history_columns(undo_commands, redo_commands)
+        )
+
+
+def _set_text_if_changed(widget, text: str):
+    """Set a widget's text, skipping the repaint if it is unchanged."""
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def _set_tooltip_if_changed(widget, text: str):
+    """Set a widget's tooltip only if it is different."""
+    if widget.toolTip() != text:
+        widget.setToolTip(text)
+
+
+# Bursts of command signals are coalesced into one refresh per frame (~60 Hz)
+REFRESH_INTERVAL_MS = 16
+
+
+class UndoRedoState(QObject):
+    """
+    Undo/redo availability shared by every history widget of a manager.
+
+    The command manager is queried once per change and the result is
+    broadcast through stateChanged, so panels and toolbars don't each poll
+    it. Use for_manager() to get the instance for a command manager.
+    """
+
+    # can_undo, can_redo; listeners fetch descriptions when they show them
+    stateChanged = Signal(bool, bool)
+
+    def __init__(self, command_manager: CommandManager):
+        """
+        Initialize undo/redo state tracking.
+
+        Args:
+            command_manager: Command manager to track; also the parent
+        """
+        super().__init__(command_manager)
+
+        self.command_manager = command_manager
+        self._key = self._query()
+        self.state = self._key[:2]
+
+        # The manager signals before clearing its executing flag, so the
+        # state is read once control is back in the event loop
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(REFRESH_INTERVAL_MS)
+        self._update_timer.timeout.connect(self.update)
+
+        # history_changed accompanies every execute, undo and redo
+        command_manager.history_changed.connect(self.schedule_update)
+
+    @classmethod
+    def for_manager(cls, command_manager: CommandManager) -> "UndoRedoState":
+        """
+        Get the shared state for a command manager, creating it if needed.
+
+        Args:
+            command_manager: Command manager instance
+
+        Returns:
+            UndoRedoState owned by the command manager
+        """
+        state = command_manager.findChild(cls)
+        if state is None:
+            state = cls(command_manager)
+        return state
+
+    def schedule_update(self):
+        """Update the state once the command manager has settled."""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def update(self):
+        """Query the command manager and announce any change."""
+        key = self._query()
+        if key != self._key:
+            self._key = key
+            self.state = key[:2]
+            self.stateChanged.emit(*self.state)
+
+    def _query(self) -> tuple:
+        """Read undo/redo availability and the commands on top of the stacks."""
+        manager = self.command_manager
+        undo_stack = manager.undo_stack
+        redo_stack = manager.redo_stack
+        # A new top command changes the descriptions even if availability
+        # stays the same, so listeners showing them are told as well
+        return (
+            manager.can_undo(),
+            manager.can_redo(),
+            id(undo_stack[-1]) if undo_stack else None,
+            id(redo_stack[-1]) if redo_stack else None,
+        )
+
+
 class HistoryPanel(QWidget):
     """
     Panel widget for displaying command history and undo/redo controls.
@@ -55,18 +429,31 @@ class HistoryPanel(QWidget):
 
         self.command_manager = command_manager
         self.auto_refresh_enabled = True
+        self._last_fingerprint = None
+        self._memory_bucket: Optional[str] = None
+        self._undo_state = UndoRedoState.for_manager(command_manager)
+
+        # Background history snapshots; at most one is built at a time
+        self._history_fetcher = HistorySnapshotFetcher()
+        self._history_fetcher.finished.connect(
+            self._apply_history_snapshot, Qt.QueuedConnection
+        )
+        self._fetch_in_flight = False
+        self._fetch_pending = False
+
+        # Throttle for refresh requests
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
 
         # Setup UI
         self.setup_ui()
         self.connect_signals()
 
-        # Setup auto-refresh timer
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_display)
-        self.refresh_timer.start(1000)  # Refresh every second
-
         # Initial display update
-        self.refresh_display()
+        self.update_buttons(*self._undo_state.state)
+        self._do_refresh()
 
     def setup_ui(self):
         """Setup the user interface."""
@@ -100,6 +487,7 @@ class HistoryPanel(QWidget):
         self.undo_button.setEnabled(False)
         self.undo_button.clicked.connect(self.undo_requested.emit)
         self.undo_button.setToolTip("Undo the last command")
+        self.undo_button.installEventFilter(self)
         controls_layout.addWidget(self.undo_button)
 
         # Redo button
@@ -107,6 +495,7 @@ class HistoryPanel(QWidget):
         self.redo_button.setEnabled(False)
         self.redo_button.clicked.connect(self.redo_requested.emit)
         self.redo_button.setToolTip("Redo the last undone command")
+        self.redo_button.installEventFilter(self)
         controls_layout.addWidget(self.redo_button)
 
         # Clear history button
@@ -120,31 +509,48 @@ class HistoryPanel(QWidget):
     def setup_history_table(self, layout: QVBoxLayout):
         """Setup command history table."""
         # History table
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(4)
-        self.history_table.setHorizontalHeaderLabels(
-            ["Command", "Type", "State", "Time"]
-        )
+        self.history_model = CommandHistoryModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setItemDelegate(HistoryDelegate(self.history_table))
 
         # Configure table appearance
         self.history_table.setAlternatingRowColors(True)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.history_table.setSelectionBehavior(QTableView.SelectRows)
+        self.history_table.setSelectionMode(QTableView.SingleSelection)
         self.history_table.setSortingEnabled(False)
 
         # Configure column widths
         header = self.history_table.horizontalHeader()
-        header.setStretchLastSection(True)
+        header.setStretchLastSection(False)
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Command column
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Type
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # State
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Time
+
+        # Type, state and time are short, bounded strings; fixed starting
+        # widths spare the header from measuring every row on each update
+        for column, width in ((1, 80), (2, 80), (3, 70)):
+            header.setSectionResizeMode(column, QHeaderView.Interactive)
+            header.resizeSection(column, width)
 
         # Set maximum height to prevent it from taking too much space
         self.history_table.setMaximumHeight(200)
 
         layout.addWidget(self.history_table)
 
+        # Only the most recent commands are listed unless asked otherwise
+        self.show_all_checkbox = QCheckBox("Show all commands")
+        self.show_all_checkbox.setToolTip(
+            f"List more than the {CommandHistoryModel.DEFAULT_ROW_LIMIT} "
+            "most recent commands"
+        )
+        self.show_all_checkbox.toggled.connect(self.on_show_all_toggled)
+        layout.addWidget(self.show_all_checkbox)
+
+        # Undone commands move between the stacks, so the manager never
+        # holds more than max_history; hide the toggle if nothing is cut off
+        self.show_all_checkbox.setVisible(
+            self.command_manager.max_history > CommandHistoryModel.DEFAULT_ROW_LIMIT
+        )
+
     def setup_statistics_group(self, layout: QVBoxLayout):
         """Setup statistics display group."""
         stats_group = QGroupBox("Statistics")
@@ -188,92 +594,148 @@ class HistoryPanel(QWidget):
         self.command_manager.command_undone.connect(self.on_command_undone)
         self.command_manager.command_redone.connect(self.on_command_redone)
         self.command_manager.history_changed.connect(self.on_history_changed)
+        self._undo_state.stateChanged.connect(self.update_buttons)
 
     def refresh_display(self):
+        """
+        Request a display refresh.
+
+        Requests are coalesced so at most one refresh runs per frame. The
+        refresh also runs after control returns to the event loop, when the
+        command manager has cleared its executing flag; refreshing inside
+        its signal handlers would show stale button states.
+        """
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_refresh(self):
         """Refresh the entire display."""
         if not self.auto_refresh_enabled:
             return
 
-        self.update_buttons()
-        self.update_history_table()
-        self.update_statistics()
-        self.update_memory_display()
+        # One snapshot of the manager serves every part of the display
+        stats = self.command_manager.get_statistics()
 
-    def update_buttons(self):
-        """Update undo/redo button states and tooltips."""
-        can_undo = self.command_manager.can_undo()
-        can_redo = self.command_manager.can_redo()
+        # Nothing to redraw while the history is unchanged
+        fingerprint = self._history_fingerprint(stats)
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+
+        self._request_history_snapshot()
+        self.update_statistics(stats)
+        self.update_memory_display(stats)
+
+    def _history_fingerprint(self, stats: Dict) -> tuple:
+        """
+        Build a cheap value that changes whenever the displayed history does.
+
+        Args:
+            stats: Snapshot from command_manager.get_statistics()
+
+        Returns:
+            Tuple of stack sizes, memory, execution flag and top commands
+        """
+        undo_stack = self.command_manager.undo_stack
+        redo_stack = self.command_manager.redo_stack
+        return (
+            stats["total_commands"],
+            stats["undo_stack_size"],
+            stats["redo_stack_size"],
+            stats["estimated_memory_mb"],
+            stats["is_executing"],
+            # Stack sizes stay the same when a full undo stack rolls over
+            id(undo_stack[-1]) if undo_stack else None,
+            id(redo_stack[-1]) if redo_stack else None,
+        )
+
+    def update_buttons(self, can_undo: bool, can_redo: bool):
+        """Update undo/redo button states.
+
+        Tooltips are filled in by eventFilter() when they are shown.
+
+        Args:
+            can_undo: Whether a command can be undone
+            can_redo: Whether a command can be redone
+        """
+        if not self.auto_refresh_enabled:
+            return
 
-        # Update button states
         self.undo_button.setEnabled(can_undo)
         self.redo_button.setEnabled(can_redo)
 
-        # Update tooltips with command descriptions
-        if can_undo:
-            undo_desc = self.command_manager.get_undo_description()
-            self.undo_button.setToolTip(f"Undo: {undo_desc}")
-        else:
-            self.undo_button.setToolTip("Nothing to undo")
+    def eventFilter(self, watched, event):
+        """Describe the undo/redo command only when its tooltip is shown."""
+        if event.type() == QEvent.ToolTip:
+            can_undo, can_redo = self._undo_state.state
+            manager = self.command_manager
+            if watched is self.undo_button:
+                if can_undo:
+                    undo_desc = manager.get_undo_description() or ""
+                    _set_tooltip_if_changed(self.undo_button, f"Undo: {undo_desc}")
+                else:
+                    _set_tooltip_if_changed(self.undo_button, "Nothing to undo")
+            elif watched is self.redo_button:
+                if can_redo:
+                    redo_desc = manager.get_redo_description() or ""
+                    _set_tooltip_if_changed(self.redo_button, f"Redo: {redo_desc}")
+                else:
+                    _set_tooltip_if_changed(self.redo_button, "Nothing to redo")
+
+        return super().eventFilter(watched, event)
+
+    def _request_history_snapshot(self):
+        """Build a fresh history snapshot off the GUI thread."""
+        if self._fetch_in_flight:
+            # Rebuild once the running job reports back
+            self._fetch_pending = True
+            return
 
-        if can_redo:
-            redo_desc = self.command_manager.get_redo_description()
-            self.redo_button.setToolTip(f"Redo: {redo_desc}")
-        else:
-            self.redo_button.setToolTip("Nothing to redo")
-
-    def update_history_table(self):
-        """Update the command history table."""
-        history = self.command_manager.get_history()
-
-        # Set row count
-        self.history_table.setRowCount(len(history))
-
-        # Populate table
-        for row, command_info in enumerate(history):
-            # Command description
-            desc_item = QTableWidgetItem(command_info["description"])
-            if command_info["stack"] == "redo":
-                desc_item.setForeground(Qt.gray)
-            self.history_table.setItem(row, 0, desc_item)
-
-            # Command type
-            type_item = QTableWidgetItem(command_info["type"].title())
-            if command_info["stack"] == "redo":
-                type_item.setForeground(Qt.gray)
-            self.history_table.setItem(row, 1, type_item)
-
-            # Command state
-            state_item = QTableWidgetItem(command_info["state"].title())
-            state_color = self.get_state_color(command_info["state"])
-            state_item.setForeground(state_color)
-            if command_info["stack"] == "redo":
-                state_item.setForeground(Qt.gray)
-            self.history_table.setItem(row, 2, state_item)
-
-            # Execution time
-            exec_time = command_info.get("execution_time")
-            time_text = f"{exec_time:.3f}s" if exec_time else "N/A"
-            time_item = QTableWidgetItem(time_text)
-            if command_info["stack"] == "redo":
-                time_item.setForeground(Qt.gray)
-            self.history_table.setItem(row, 3, time_item)
+        self._fetch_in_flight = True
+        self._history_fetcher.fetch(*self.command_manager.snapshot_stacks())
+
+    def _apply_history_snapshot(self, history: tuple):
+        """Show a snapshot built by the history fetcher."""
+        self._fetch_in_flight = False
+        if self._fetch_pending:
+            # The history changed while this snapshot was being built
+            self._fetch_pending = False
+            self._request_history_snapshot()
+            return
+
+        self.update_history_table(history)
+
+    def update_history_table(self, history: tuple):
+        """
+        Update the command history table.
+
+        Args:
+            history: History column lists from get_history_columns()
+        """
+        # Only follow the end of the list if the user hasn't scrolled away
+        scroll_bar = self.history_table.verticalScrollBar()
+        was_at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 2
+
+        self.history_model.set_history(history)
 
         # Scroll to bottom to show most recent commands
-        if history:
+        if history[0] and was_at_bottom:
             self.history_table.scrollToBottom()
 
-    def update_statistics(self):
+    def update_statistics(self, stats: Dict):
         """Update statistics display."""
-        stats = self.command_manager.get_statistics()
-
-        self.total_commands_label.setText(f"Total Commands: {stats['total_commands']}")
-        self.undo_stack_label.setText(f"Undo Stack: {stats['undo_stack_size']}")
-        self.redo_stack_label.setText(f"Redo Stack: {stats['redo_stack_size']}")
+        _set_text_if_changed(
+            self.total_commands_label, f"Total Commands: {stats['total_commands']}"
+        )
+        _set_text_if_changed(
+            self.undo_stack_label, f"Undo Stack: {stats['undo_stack_size']}"
+        )
+        _set_text_if_changed(
+            self.redo_stack_label, f"Redo Stack: {stats['redo_stack_size']}"
+        )
 
-    def update_memory_display(self):
+    def update_memory_display(self, stats: Dict):
         """Update memory usage display."""
-        stats = self.command_manager.get_statistics()
-
         current_mb = stats["estimated_memory_mb"]
         max_mb = stats["max_memory_mb"]
 
@@ -282,60 +744,59 @@ class HistoryPanel(QWidget):
         self.memory_progress.setValue(int(current_mb))
 
         # Update details label
-        self.memory_details_label.setText(f"{current_mb:.1f} MB / {max_mb:.1f} MB")
+        _set_text_if_changed(
+            self.memory_details_label, f"{current_mb:.1f} MB / {max_mb:.1f} MB"
+        )
 
         # Color code based on usage
         usage_percent = (current_mb / max_mb) * 100 if max_mb > 0 else 0
 
         if usage_percent > 90:
-            style = "QProgressBar::chunk { background-color: #ff4444; }"
+            bucket = "red"
         elif usage_percent > 75:
-            style = "QProgressBar::chunk { background-color: #ffaa00; }"
+            bucket = "amber"
         else:
-            style = "QProgressBar::chunk { background-color: #44ff44; }"
+            bucket = "green"
 
-        self.memory_progress.setStyleSheet(style)
+        # Restyling re-polishes the widget, so only do it on transitions
+        if bucket != self._memory_bucket:
+            self._memory_bucket = bucket
+            self.memory_progress.setStyleSheet(MEMORY_BAR_STYLES[bucket])
 
     def get_state_color(self, state: str):
         """Get color for command state display."""
-        color_map = {
-            "completed": Qt.darkGreen,
-            "failed": Qt.red,
-            "executing": Qt.blue,
-            "undoing": Qt.magenta,
-            "undone": Qt.gray,
-            "pending": Qt.black,
-        }
-        return color_map.get(state, Qt.black)
+        return CommandHistoryModel.state_brush(state)
 
     # Signal handlers
     def on_command_executed(self, command_info: Dict):
         """Handle command executed signal."""
-        # The refresh timer will update the display
-        pass
+        self.refresh_display()
 
     def on_command_undone(self, command_info: Dict):
         """Handle command undone signal."""
-        # The refresh timer will update the display
-        pass
+        self.refresh_display()
 
     def on_command_redone(self, command_info: Dict):
         """Handle command redone signal."""
-        # The refresh timer will update the display
-        pass
+        self.refresh_display()
 
     def on_history_changed(self):
         """Handle history changed signal."""
-        # Immediate update for history changes
         self.refresh_display()
 
+    def on_show_all_toggled(self, checked: bool):
+        """Handle show all commands toggle."""
+        self.history_model.set_row_limit(
+            None if checked else CommandHistoryModel.DEFAULT_ROW_LIMIT
+        )
+
     def set_auto_refresh(self, enabled: bool):
         """Enable or disable auto-refresh."""
         self.auto_refresh_enabled = enabled
-        if enabled and not self.refresh_timer.isActive():
-            self.refresh_timer.start(1000)
-        elif not enabled:
-            self.refresh_timer.stop()
+        if enabled:
+            # Catch up on changes ignored while disabled
+            self.update_buttons(*self._undo_state.state)
+            self._do_refresh()
 
 
 class HistoryToolbar(QWidget):
@@ -358,18 +819,14 @@ class HistoryToolbar(QWidget):
         super().__init__(parent)
 
         self.command_manager = command_manager
+        self._undo_state = UndoRedoState.for_manager(command_manager)
 
         # Setup UI
         self.setup_ui()
         self.connect_signals()
 
-        # Setup update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_buttons)
-        self.update_timer.start(500)  # Update every 0.5 seconds
-
         # Initial update
-        self.update_buttons()
+        self.update_buttons(*self._undo_state.state)
 
     def setup_ui(self):
         """Setup the user interface."""
@@ -395,31 +852,34 @@ class HistoryToolbar(QWidget):
         layout.addStretch()
 
     def connect_signals(self):
-        """Connect command manager signals."""
-        self.command_manager.history_changed.connect(self.update_buttons)
+        """Connect undo/redo state signals."""
+        self._undo_state.stateChanged.connect(self.update_buttons)
 
-    def update_buttons(self):
-        """Update button states and tooltips."""
-        can_undo = self.command_manager.can_undo()
-        can_redo = self.command_manager.can_redo()
+    def update_buttons(self, can_undo: bool, can_redo: bool):
+        """
+        Update button states and tooltips.
 
+        Args:
+            can_undo: Whether a command can be undone
+            can_redo: Whether a command can be redone
+        """
         # Update button states
         self.undo_button.setEnabled(can_undo)
         self.redo_button.setEnabled(can_redo)
 
-        # Update button text with command descriptions
+        # The button text always shows the descriptions, so fetch them here
         if can_undo:
-            undo_desc = self.command_manager.get_undo_description()
-            self.undo_button.setText(f"Undo {undo_desc}")
-            self.undo_button.setToolTip(f"Undo: {undo_desc}")
+            undo_desc = self.command_manager.get_undo_description() or ""
+            _set_text_if_changed(self.undo_button, f"Undo {undo_desc}")
+            _set_tooltip_if_changed(self.undo_button, f"Undo: {undo_desc}")
         else:
-            self.undo_button.setText("Undo")
-            self.undo_button.setToolTip("Nothing to undo")
+            _set_text_if_changed(self.undo_button, "Undo")
+            _set_tooltip_if_changed(self.undo_button, "Nothing to undo")
 
         if can_redo:
-            redo_desc = self.command_manager.get_redo_description()
-            self.redo_button.setText(f"Redo {redo_desc}")
-            self.redo_button.setToolTip(f"Redo: {redo_desc}")
+            redo_desc = self.command_manager.get_redo_description() or ""
+            _set_text_if_changed(self.redo_button, f"Redo {redo_desc}")
+            _set_tooltip_if_changed(self.redo_button, f"Redo: {redo_desc}")
         else:
-            self.redo_button.setText("Redo")
-            self.redo_button.setToolTip("Nothing to redo")
+            _set_text_if_changed(self.redo_button, "Redo")
+            _set_tooltip_if_changed(self.redo_button, "Nothing to redo")
@@ -2,11 +2,22 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
-
-from PySide6.QtCore import QSize, Qt, Signal
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QAction, QColor, QFont, QIcon, QPainter, QPixmap
 from PySide6.QtWidgets import (
+    QApplication,
     QCheckBox,
     QColorDialog,
     QComboBox,
@@ -22,9 +33,11 @@ from PySide6.QtWidgets import (
     QMenu,
     QPushButton,
     QSizePolicy,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QToolButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -32,17 +45,60 @@ from PySide6.QtWidgets import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class LayerProps:
+    """Properties of a drawing layer."""
+
+    name: str
+    color: QColor
+    line_type: str = "continuous"
+    line_weight: float = 0.25
+    visible: bool = True
+    locked: bool = False
+    printable: bool = True
+
+    @classmethod
+    def from_dict(cls, name: str, properties: Dict[str, Any]) -> "LayerProps":
+        """Create layer properties from a properties dictionary."""
+        return cls(
+            name=name,
+            color=QColor(properties.get("color", "#FFFFFF")),
+            line_type=properties.get("line_type", "continuous"),
+            line_weight=properties.get("line_weight", 0.25),
+            visible=properties.get("visible", True),
+            locked=properties.get("locked", False),
+            printable=properties.get("printable", True),
+        )
+
+    def update(self, properties: Dict[str, Any]):
+        """Set the properties present in a dictionary, ignoring unknown keys."""
+        for key, value in properties.items():
+            if key in self.__dataclass_fields__:
+                setattr(self, key, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the properties as a plain dictionary."""
+        return {
+            "name": self.name,
+            "color": self.color,
+            "line_type": self.line_type,
+            "line_weight": self.line_weight,
+            "visible": self.visible,
+            "locked": self.locked,
+            "printable": self.printable,
+        }
+
+
 class LayerDialog(QDialog):
     """Dialog for creating or editing layers."""
 
     def __init__(self, parent=None, layer_data=None):
         super().__init__(parent)
-        self.layer_data = layer_data or {}
         self._setup_ui()
+        self.set_layer_data(layer_data)
 
     def _setup_ui(self):
         """Setup the layer dialog UI."""
-        self.setWindowTitle("Layer Properties" if self.layer_data else "New Layer")
         self.setModal(True)
         self.resize(400, 300)
 
@@ -53,7 +109,6 @@ class LayerDialog(QDialog):
 
         # Layer name
         self.name_edit = QLineEdit()
-        self.name_edit.setText(self.layer_data.get("name", ""))
         self.name_edit.setPlaceholderText("Enter layer name")
         form_layout.addRow("Name:", self.name_edit)
 
@@ -61,8 +116,6 @@ class LayerDialog(QDialog):
         color_layout = QHBoxLayout()
         self.color_button = QPushButton()
         self.color_button.setFixedSize(50, 25)
-        self.color = QColor(self.layer_data.get("color", "#FFFFFF"))
-        self._update_color_button()
         self.color_button.clicked.connect(self._choose_color)
         color_layout.addWidget(self.color_button)
         color_layout.addStretch()
@@ -71,31 +124,24 @@ class LayerDialog(QDialog):
         # Line type
         self.line_type_combo = QComboBox()
         self.line_type_combo.addItems(["continuous", "dashed", "dotted", "dash_dot"])
-        self.line_type_combo.setCurrentText(
-            self.layer_data.get("line_type", "continuous")
-        )
         form_layout.addRow("Line Type:", self.line_type_combo)
 
         # Line weight
         self.line_weight_spin = QDoubleSpinBox()
         self.line_weight_spin.setDecimals(2)
         self.line_weight_spin.setRange(0.01, 10.0)
-        self.line_weight_spin.setValue(self.layer_data.get("line_weight", 0.25))
         form_layout.addRow("Line Weight:", self.line_weight_spin)
 
         # Properties
         properties_layout = QVBoxLayout()
 
         self.visible_check = QCheckBox("Visible")
-        self.visible_check.setChecked(self.layer_data.get("visible", True))
         properties_layout.addWidget(self.visible_check)
 
         self.locked_check = QCheckBox("Locked")
-        self.locked_check.setChecked(self.layer_data.get("locked", False))
         properties_layout.addWidget(self.locked_check)
 
         self.printable_check = QCheckBox("Printable")
-        self.printable_check.setChecked(self.layer_data.get("printable", True))
         properties_layout.addWidget(self.printable_check)
 
         form_layout.addRow("Properties:", properties_layout)
@@ -110,6 +156,27 @@ class LayerDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    def set_layer_data(self, layer_data: Optional[Dict[str, Any]]):
+        """
+        Fill the dialog with a layer's properties, so one dialog can be reused.
+
+        Args:
+            layer_data: Properties of the layer to edit, or None for a new layer
+        """
+        self.layer_data = layer_data or {}
+        self.setWindowTitle("Layer Properties" if self.layer_data else "New Layer")
+
+        self.name_edit.setText(self.layer_data.get("name", ""))
+        self.color = QColor(self.layer_data.get("color", "#FFFFFF"))
+        self._update_color_button()
+        self.line_type_combo.setCurrentText(
+            self.layer_data.get("line_type", "continuous")
+        )
+        self.line_weight_spin.setValue(self.layer_data.get("line_weight", 0.25))
+        self.visible_check.setChecked(self.layer_data.get("visible", True))
+        self.locked_check.setChecked(self.layer_data.get("locked", False))
+        self.printable_check.setChecked(self.layer_data.get("printable", True))
+
         # Set focus to name field
         self.name_edit.setFocus()
         self.name_edit.selectAll()
@@ -141,6 +208,248 @@ class LayerDialog(QDialog):
         }
 
 
+class LayersModel(QAbstractTableModel):
+    """
+    Table model listing layers for the layers tree view.
+
+    Layer properties stay in the panel's layers dict; the model keeps the
+    row order and reads properties on demand, so only painted rows are
+    ever formatted.
+    """
+
+    HEADERS = ("", "Name", "Color", "Type")
+
+    # Columns
+    VISIBLE_COLUMN = 0
+    NAME_COLUMN = 1
+    COLOR_COLUMN = 2
+    TYPE_COLUMN = 3
+
+    # Column showing each layer property that has one
+    PROPERTY_COLUMNS = {
+        "visible": VISIBLE_COLUMN,
+        "name": NAME_COLUMN,
+        "locked": NAME_COLUMN,
+        "color": COLOR_COLUMN,
+        "line_type": TYPE_COLUMN,
+    }
+
+    # Layer color for the swatch delegate
+    COLOR_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    _CHECKED = Qt.CheckState.Checked
+    _UNCHECKED = Qt.CheckState.Unchecked
+
+    # Signals
+    visibility_toggled = Signal(str, bool)  # layer_name, visible
+
+    def __init__(self, layers: Dict[str, LayerProps], lock_icon: QIcon, parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            layers: Layer properties by name, shared with the panel
+            lock_icon: Icon shown next to locked layer names
+            parent: Qt parent object
+        """
+        super().__init__(parent)
+        self._layers = layers
+        self._names: List[str] = []
+        self._rows: Dict[str, int] = {}  # layer name -> row
+        self._color_names: Dict[str, str] = {}  # layer name -> "#RRGGBB"
+        self._current_layer: Optional[str] = None
+        self._lock_icon = lock_icon
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    def layer_name(self, row: int) -> str:
+        """Get the name of the layer shown in a row."""
+        return self._names[row]
+
+    def row_of(self, name: str) -> int:
+        """Get the row showing a layer, or -1 if it isn't listed."""
+        return self._rows.get(name, -1)
+
+    def reset_layers(self):
+        """Rebuild every row from the layers dict."""
+        self.beginResetModel()
+        self._names = list(self._layers)
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        self._color_names.clear()
+        self.endResetModel()
+
+    def add_layer(self, name: str):
+        """Append a row for a layer added to the layers dict."""
+        if self.row_of(name) >= 0:
+            self.layer_changed(name)
+            return
+
+        row = len(self._names)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._names.append(name)
+        self._rows[name] = row
+        self.endInsertRows()
+
+    def remove_layer(self, name: str):
+        """Remove the row of a layer."""
+        row = self.row_of(name)
+        if row < 0:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._names[row]
+        del self._rows[name]
+        self._color_names.pop(name, None)
+        # Rows below the removed one move up
+        for moved_row in range(row, len(self._names)):
+            self._rows[self._names[moved_row]] = moved_row
+        self.endRemoveRows()
+
+    def layer_changed(self, name: str):
+        """Signal that a layer's properties changed."""
+        self._color_names.pop(name, None)
+        row = self.row_of(name)
+        if row >= 0:
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.columnCount() - 1)
+            )
+
+    def layers_changed(self, column: Optional[int] = None):
+        """
+        Signal that every layer changed, as a single update.
+
+        Args:
+            column: The only column that changed, or None for all columns
+        """
+        if column is None or column == self.COLOR_COLUMN:
+            self._color_names.clear()
+        if not self._names:
+            return
+
+        first = 0 if column is None else column
+        last = self.columnCount() - 1 if column is None else column
+        self.dataChanged.emit(
+            self.index(0, first), self.index(len(self._names) - 1, last)
+        )
+
+    def set_current_layer(self, name: Optional[str]):
+        """Show a layer's name in bold as the current layer, or none if None."""
+        old_current = self._current_layer
+        self._current_layer = name
+
+        for layer in (old_current, name):
+            row = self.row_of(layer)
+            if row >= 0:
+                index = self.index(row, self.NAME_COLUMN)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.FontRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.VISIBLE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        name = self._names[index.row()]
+        properties = self._layers[name]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.NAME_COLUMN:
+                return name
+            if column == self.COLOR_COLUMN:
+                color_name = self._color_names.get(name)
+                if color_name is None:
+                    color_name = properties.color.name().upper()
+                    self._color_names[name] = color_name
+                return color_name
+            if column == self.TYPE_COLUMN:
+                return properties.line_type
+        elif role == Qt.ItemDataRole.CheckStateRole:
+            if column == self.VISIBLE_COLUMN:
+                return self._CHECKED if properties.visible else self._UNCHECKED
+        elif role == Qt.ItemDataRole.DecorationRole:
+            if column == self.NAME_COLUMN and properties.locked:
+                return self._lock_icon
+        elif role == Qt.ItemDataRole.FontRole:
+            if column == self.NAME_COLUMN and name == self._current_layer:
+                return self._bold_font
+        elif role == Qt.ItemDataRole.UserRole:
+            return name
+        elif role == self.COLOR_ROLE:
+            if column == self.COLOR_COLUMN:
+                return properties.color
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Toggle layer visibility from the visibility checkbox."""
+        if (
+            not index.isValid()
+            or index.column() != self.VISIBLE_COLUMN
+            or role != Qt.ItemDataRole.CheckStateRole
+        ):
+            return False
+
+        name = self._names[index.row()]
+        visible = Qt.CheckState(value) == self._CHECKED
+        properties = self._layers[name]
+        if properties.visible == visible:
+            # Nothing changed; don't send an update to the backend
+            return True
+        properties.visible = visible
+
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.visibility_toggled.emit(name, visible)
+        return True
+
+
+class LayerColorDelegate(QStyledItemDelegate):
+    """Paints the layer color swatch without building an icon per row."""
+
+    SWATCH_SIZE = QSize(20, 16)
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+
+        # Reserve the decoration slot; paint() fills it with the color
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+        option.decorationSize = self.SWATCH_SIZE
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+
+        color = index.data(LayersModel.COLOR_ROLE)
+        if color is None:
+            return
+
+        swatch_option = QStyleOptionViewItem(option)
+        self.initStyleOption(swatch_option, index)
+        widget = swatch_option.widget
+        style = widget.style() if widget else QApplication.style()
+        swatch_rect = style.subElementRect(
+            QStyle.SubElement.SE_ItemViewItemDecoration, swatch_option, widget
+        )
+        painter.fillRect(swatch_rect, color)
+
+
 class LayersPanel(QWidget):
     """Panel for managing drawing layers."""
 
@@ -150,14 +459,41 @@ class LayersPanel(QWidget):
     layer_modified = Signal(str, dict)  # layer_name, layer_properties
     layer_selected = Signal(str)  # layer_name
     layer_visibility_changed = Signal(str, bool)  # layer_name, visible
+    layers_bulk_changed = Signal(dict)  # layer_name -> layer_properties
+
+    # Text icons by glyph, shared by all panels
+    _ICON_CACHE: Dict[str, QIcon] = {}
+
+    # Visibility toggles within this window are sent to the backend together
+    BACKEND_FLUSH_INTERVAL_MS = 50
+
+    # Color sent for layers without one
+    _DEFAULT_COLOR = QColor(255, 255, 255)
+
+    # Set once the missing asyncio event loop has been reported
+    _warned_no_event_loop = False
 
     def __init__(self, parent: Optional[QWidget] = None, api_client=None):
         super().__init__(parent)
 
         self._api_client = api_client
         self._document_id = None  # Will be set when document is opened
-        self._layers: Dict[str, Dict[str, Any]] = {}
-        self._current_layer = "0"
+        self._layers: Dict[str, LayerProps] = {}
+        self._current_layer: Optional[str] = None  # Set to "0" on creation
+
+        # Layer updates waiting to be sent to the backend
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.BACKEND_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+        # Backend tasks still running, so newer requests can replace them
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._load_task: Optional[asyncio.Task] = None
+
+        # Created on first use and reused for every new or edited layer
+        self._layer_dialog: Optional[LayerDialog] = None
 
         self._setup_ui()
         self._create_default_layer()
@@ -222,23 +558,33 @@ class LayersPanel(QWidget):
         layout.addWidget(separator)
 
         # Layers tree
-        self.layers_tree = QTreeWidget()
-        self.layers_tree.setHeaderLabels(["", "Name", "Color", "Type"])
+        self.layers_model = LayersModel(self._layers, self._create_icon("🔒"), self)
+        self.layers_tree = QTreeView()
+        self.layers_tree.setModel(self.layers_model)
+        self.layers_tree.setItemDelegateForColumn(
+            LayersModel.COLOR_COLUMN, LayerColorDelegate(self.layers_tree)
+        )
         self.layers_tree.setRootIsDecorated(False)
         self.layers_tree.setAlternatingRowColors(True)
-        self.layers_tree.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        self.layers_tree.setSelectionMode(QTreeView.SelectionMode.SingleSelection)
 
-        # Set column widths
+        # Rows all share one height, so the view doesn't measure each row
+        self.layers_tree.setUniformRowHeights(True)
+
+        # Set column widths; none are sized from their contents
         header = self.layers_tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
         header.resizeSection(0, 20)  # Visibility icon
         header.resizeSection(1, 80)  # Name
         header.resizeSection(2, 40)  # Color
-        header.setStretchLastSection(True)  # Type
 
         # Connect signals
-        self.layers_tree.itemChanged.connect(self._on_item_changed)
-        self.layers_tree.itemClicked.connect(self._on_item_clicked)
-        self.layers_tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.layers_model.visibility_toggled.connect(self._on_visibility_toggled)
+        self.layers_tree.clicked.connect(self._on_item_clicked)
+        self.layers_tree.doubleClicked.connect(self._on_item_double_clicked)
 
         layout.addWidget(self.layers_tree)
 
@@ -259,16 +605,20 @@ class LayersPanel(QWidget):
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
 
     def _create_icon(self, text: str) -> QIcon:
-        """Create a simple text-based icon."""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.GlobalColor.transparent)
+        """Create a simple text-based icon, rendering each glyph only once."""
+        icon = self._ICON_CACHE.get(text)
+        if icon is None:
+            pixmap = QPixmap(16, 16)
+            pixmap.fill(Qt.GlobalColor.transparent)
 
-        painter = QPainter(pixmap)
-        painter.setPen(Qt.GlobalColor.black)
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
-        painter.end()
+            painter = QPainter(pixmap)
+            painter.setPen(Qt.GlobalColor.black)
+            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+            painter.end()
 
-        return QIcon(pixmap)
+            icon = QIcon(pixmap)
+            self._ICON_CACHE[text] = icon
+        return icon
 
     def _setup_options_menu(self):
         """Setup the options menu."""
@@ -314,44 +664,10 @@ class LayersPanel(QWidget):
 
     def add_layer(self, name: str, properties: Dict[str, Any]):
         """Add a new layer."""
-        self._layers[name] = properties.copy()
-        self._add_layer_item(name, properties)
+        self._layers[name] = LayerProps.from_dict(name, properties)
+        self.layers_model.add_layer(name)
         logger.info(f"Added layer: {name}")
 
-    def _add_layer_item(self, name: str, properties: Dict[str, Any]):
-        """Add a layer item to the tree."""
-        item = QTreeWidgetItem(self.layers_tree)
-
-        # Set item data
-        item.setData(0, Qt.ItemDataRole.UserRole, name)
-
-        # Visibility checkbox
-        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-        item.setCheckState(
-            0,
-            Qt.CheckState.Checked if properties["visible"] else Qt.CheckState.Unchecked,
-        )
-
-        # Layer name
-        item.setText(1, name)
-        if properties.get("locked", False):
-            item.setIcon(1, self._create_icon("🔒"))
-
-        # Color
-        color_pixmap = QPixmap(20, 16)
-        color_pixmap.fill(properties["color"])
-        item.setIcon(2, QIcon(color_pixmap))
-        item.setText(2, properties["color"].name().upper())
-
-        # Line type
-        item.setText(3, properties["line_type"])
-
-        # Mark current layer
-        if name == self._current_layer:
-            font = item.font(1)
-            font.setBold(True)
-            item.setFont(1, font)
-
     def remove_layer(self, name: str):
         """Remove a layer."""
         if name == "0":
@@ -362,12 +678,11 @@ class LayersPanel(QWidget):
             logger.warning(f"Layer {name} does not exist")
             return False
 
+        # Updates still queued for it would recreate or overwrite it
+        self._discard_updates(name)
+
         # Remove from tree
-        for i in range(self.layers_tree.topLevelItemCount()):
-            item = self.layers_tree.topLevelItem(i)
-            if item and item.data(0, Qt.ItemDataRole.UserRole) == name:
-                self.layers_tree.takeTopLevelItem(i)
-                break
+        self.layers_model.remove_layer(name)
 
         # Remove from layers dict
         del self._layers[name]
@@ -385,6 +700,9 @@ class LayersPanel(QWidget):
             logger.warning(f"Layer {name} does not exist")
             return
 
+        if name == self._current_layer:
+            return
+
         old_current = self._current_layer
         self._current_layer = name
 
@@ -392,13 +710,7 @@ class LayersPanel(QWidget):
         self.current_label.setText(name)
 
         # Update tree items formatting
-        for i in range(self.layers_tree.topLevelItemCount()):
-            item = self.layers_tree.topLevelItem(i)
-            if item:
-                layer_name = item.data(0, Qt.ItemDataRole.UserRole)
-                font = item.font(1)
-                font.setBold(layer_name == name)
-                item.setFont(1, font)
+        self.layers_model.set_current_layer(name)
 
         self.layer_selected.emit(name)
         logger.debug(f"Current layer changed from {old_current} to {name}")
@@ -407,55 +719,39 @@ class LayersPanel(QWidget):
         """Get the current layer name."""
         return self._current_layer
 
-    def get_layers(self) -> Dict[str, Dict[str, Any]]:
-        """Get all layers."""
-        return self._layers.copy()
+    def get_layers(self) -> Mapping[str, LayerProps]:
+        """Get a read-only, live view of all layers."""
+        return MappingProxyType(self._layers)
+
+    def snapshot_layers(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of all layers' properties as plain dictionaries."""
+        return {name: layer.to_dict() for name, layer in self._layers.items()}
 
     def update_layer(self, name: str, properties: Dict[str, Any]):
         """Update layer properties."""
         if name not in self._layers:
             return
 
-        self._layers[name].update(properties)
+        layer = self._layers[name]
+        layer.update(properties)
 
         # Update tree item
-        for i in range(self.layers_tree.topLevelItemCount()):
-            item = self.layers_tree.topLevelItem(i)
-            if item and item.data(0, Qt.ItemDataRole.UserRole) == name:
-                self._update_layer_item(item, name, self._layers[name])
-                break
+        self.layers_model.layer_changed(name)
 
-        self.layer_modified.emit(name, self._layers[name])
+        self.layer_modified.emit(name, layer.to_dict())
 
-    def _update_layer_item(
-        self, item: QTreeWidgetItem, name: str, properties: Dict[str, Any]
-    ):
-        """Update a layer item in the tree."""
-        # Visibility
-        item.setCheckState(
-            0,
-            Qt.CheckState.Checked if properties["visible"] else Qt.CheckState.Unchecked,
-        )
-
-        # Name and lock icon
-        item.setText(1, name)
-        if properties.get("locked", False):
-            item.setIcon(1, self._create_icon("🔒"))
-        else:
-            item.setIcon(1, QIcon())
-
-        # Color
-        color_pixmap = QPixmap(20, 16)
-        color_pixmap.fill(properties["color"])
-        item.setIcon(2, QIcon(color_pixmap))
-        item.setText(2, properties["color"].name().upper())
-
-        # Line type
-        item.setText(3, properties["line_type"])
+    def _get_layer_dialog(
+        self, layer_data: Optional[Dict[str, Any]] = None
+    ) -> LayerDialog:
+        """Get the shared layer dialog, filled with a layer's properties."""
+        if self._layer_dialog is None:
+            self._layer_dialog = LayerDialog(self)
+        self._layer_dialog.set_layer_data(layer_data)
+        return self._layer_dialog
 
     def _new_layer(self):
         """Create a new layer."""
-        dialog = LayerDialog(self)
+        dialog = self._get_layer_dialog()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             layer_data = dialog.get_layer_data()
             name = layer_data["name"]
@@ -473,32 +769,37 @@ class LayersPanel(QWidget):
 
             # Send to backend if API client is available
             if self._api_client and self._document_id:
-                asyncio.create_task(self._create_layer_backend(layer_data))
+                self._run_async(self._create_layer_backend(layer_data))
+
+    def _selected_layer_name(self) -> Optional[str]:
+        """Get the name of the layer selected in the tree."""
+        index = self.layers_tree.currentIndex()
+        if not index.isValid():
+            return None
+        return self.layers_model.layer_name(index.row())
 
     def _delete_layer(self):
         """Delete the selected layer."""
-        current_item = self.layers_tree.currentItem()
-        if not current_item:
+        layer_name = self._selected_layer_name()
+        if layer_name is None:
             return
 
-        layer_name = current_item.data(0, Qt.ItemDataRole.UserRole)
         if self.remove_layer(layer_name):
             self.layer_deleted.emit(layer_name)
 
             # Send to backend if API client is available
             if self._api_client and self._document_id:
-                asyncio.create_task(self._delete_layer_backend(layer_name))
+                self._run_async(self._delete_layer_backend(layer_name))
 
     def _edit_layer(self):
         """Edit the selected layer."""
-        current_item = self.layers_tree.currentItem()
-        if not current_item:
+        layer_name = self._selected_layer_name()
+        if layer_name is None:
             return
 
-        layer_name = current_item.data(0, Qt.ItemDataRole.UserRole)
-        layer_data = self._layers.get(layer_name, {})
+        layer_data = self._layers[layer_name].to_dict()
 
-        dialog = LayerDialog(self, layer_data)
+        dialog = self._get_layer_dialog(layer_data)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_data = dialog.get_layer_data()
             new_name = new_data["name"]
@@ -525,74 +826,142 @@ class LayersPanel(QWidget):
 
                 # Send update to backend
                 if self._api_client and self._document_id:
-                    asyncio.create_task(
-                        self._update_layer_backend(layer_name, new_data)
-                    )
-
-    def _on_item_changed(self, item: QTreeWidgetItem, column: int):
-        """Handle item change (visibility checkbox)."""
-        if column == 0:  # Visibility column
-            layer_name = item.data(0, Qt.ItemDataRole.UserRole)
-            visible = item.checkState(0) == Qt.CheckState.Checked
+                    self._spawn_update(layer_name, new_data)
+
+    def _on_visibility_toggled(self, layer_name: str, visible: bool):
+        """Handle the visibility checkbox of a layer being toggled."""
+        self.layer_visibility_changed.emit(layer_name, visible)
+
+        # Send update to backend, coalescing rapid toggles
+        if self._api_client and self._document_id:
+            self._pending_updates[layer_name] = self._layers[layer_name].to_dict()
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Send the queued layer updates to the backend."""
+        pending = self._pending_updates
+        self._pending_updates = {}
+        for layer_name, layer_data in pending.items():
+            self._spawn_update(layer_name, layer_data)
+
+    def _spawn_update(self, layer_name: str, layer_data: Dict[str, Any]):
+        """
+        Send a layer update to the backend.
+
+        An update still in flight for the same layer is cancelled, so an
+        older response can't land after a newer one.
+
+        Args:
+            layer_name: Name of the layer to update
+            layer_data: Layer properties to send
+        """
+        old_task = self._inflight.pop(layer_name, None)
+        if old_task is not None and not old_task.done():
+            old_task.cancel()
+
+        task = self._run_async(
+            self._update_layer_backend(layer_name, layer_data, self._document_id)
+        )
+        if task is not None:
+            self._inflight[layer_name] = task
+            task.add_done_callback(partial(self._on_update_done, layer_name))
+
+    def _discard_updates(self, layer_name: Optional[str] = None):
+        """
+        Drop queued and in-flight backend updates.
+
+        Args:
+            layer_name: Layer whose updates to drop, or None for all layers
+        """
+        if layer_name is None:
+            self._pending_updates.clear()
+            self._flush_timer.stop()
+            tasks = list(self._inflight.values())
+            self._inflight.clear()
+        else:
+            self._pending_updates.pop(layer_name, None)
+            task = self._inflight.pop(layer_name, None)
+            tasks = [] if task is None else [task]
 
-            # Update layer properties
-            if layer_name in self._layers:
-                self._layers[layer_name]["visible"] = visible
-                self.layer_visibility_changed.emit(layer_name, visible)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
 
-                # Send update to backend
-                if self._api_client and self._document_id:
-                    asyncio.create_task(
-                        self._update_layer_backend(layer_name, self._layers[layer_name])
-                    )
+    def _on_update_done(self, layer_name: str, task: asyncio.Task):
+        """Forget a finished backend update unless it was replaced."""
+        if self._inflight.get(layer_name) is task:
+            del self._inflight[layer_name]
 
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_clicked(self, index: QModelIndex):
         """Handle item click."""
-        layer_name = item.data(0, Qt.ItemDataRole.UserRole)
-        if column == 1:  # Name column - set as current layer
+        layer_name = self.layers_model.layer_name(index.row())
+        if index.column() == LayersModel.NAME_COLUMN:  # Set as current layer
+            if layer_name == self._current_layer:
+                return
+
             self.set_current_layer(layer_name)
 
             # Send to backend
             if self._api_client and self._document_id:
-                asyncio.create_task(self._set_current_layer_backend(layer_name))
+                self._run_async(self._set_current_layer_backend(layer_name))
 
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_double_clicked(self, index: QModelIndex):
         """Handle item double click - edit layer."""
         self._edit_layer()
 
     def _show_all_layers(self):
         """Show all layers."""
-        for name in self._layers:
-            self._layers[name]["visible"] = True
-            self.layer_visibility_changed.emit(name, True)
-        self._refresh_tree()
+        self._set_all_layers("visible", True)
 
     def _hide_all_layers(self):
         """Hide all layers."""
-        for name in self._layers:
-            self._layers[name]["visible"] = False
-            self.layer_visibility_changed.emit(name, False)
-        self._refresh_tree()
+        self._set_all_layers("visible", False)
 
     def _lock_all_layers(self):
         """Lock all layers."""
-        for name in self._layers:
-            self._layers[name]["locked"] = True
-            self.layer_modified.emit(name, self._layers[name])
-        self._refresh_tree()
+        self._set_all_layers("locked", True)
 
     def _unlock_all_layers(self):
         """Unlock all layers."""
-        for name in self._layers:
-            self._layers[name]["locked"] = False
-            self.layer_modified.emit(name, self._layers[name])
-        self._refresh_tree()
+        self._set_all_layers("locked", False)
 
-    def _refresh_tree(self):
-        """Refresh the layers tree."""
-        self.layers_tree.clear()
-        for name, properties in self._layers.items():
-            self._add_layer_item(name, properties)
+    def _set_all_layers(self, key: str, value: Any):
+        """
+        Set one property on every layer as a single change.
+
+        The view gets one update and listeners get one layers_bulk_changed
+        signal instead of a signal per layer.
+
+        Args:
+            key: Layer property to set
+            value: New value of the property
+        """
+        for layer in self._layers.values():
+            setattr(layer, key, value)
+
+        # Only the column showing the property needs repainting
+        self.layers_model.layers_changed(LayersModel.PROPERTY_COLUMNS.get(key))
+        self.layers_bulk_changed.emit(self.snapshot_layers())
+
+    def _run_async(self, coro) -> Optional[asyncio.Task]:
+        """Schedule a coroutine on the running event loop, if there is one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Close it so Python doesn't warn about a never-awaited coroutine
+            coro.close()
+            if not LayersPanel._warned_no_event_loop:
+                LayersPanel._warned_no_event_loop = True
+                logger.warning(
+                    "No running asyncio event loop; LayersPanel backend calls "
+                    "are skipped (first skipped: %s)",
+                    coro.__qualname__,
+                )
+            else:
+                logger.debug("No running event loop; skipped %s", coro.__qualname__)
+            return None
+
+        return loop.create_task(coro)
 
     def set_api_client(self, api_client):
         """Set the API client for backend communication."""
@@ -601,10 +970,15 @@ class LayersPanel(QWidget):
 
     def set_document_id(self, document_id: str):
         """Set the current document ID."""
+        if document_id != self._document_id:
+            # Updates made in the previous document must not reach this one
+            self._discard_updates()
         self._document_id = document_id
         if self._api_client:
-            # Load layers from backend
-            asyncio.create_task(self._load_layers_from_backend())
+            # Load layers from backend, dropping a load for the old document
+            if self._load_task is not None and not self._load_task.done():
+                self._load_task.cancel()
+            self._load_task = self._run_async(self._load_layers_from_backend())
         logger.debug(f"Document ID set to: {document_id}")
 
     async def _load_layers_from_backend(self):
@@ -617,14 +991,8 @@ class LayersPanel(QWidget):
             if response.get("success", False):
                 layers_data = response.get("data", {}).get("layers", [])
 
-                # Clear current layers and load from backend
-                self._layers.clear()
-                self.layers_tree.clear()
-
-                for layer_proto in layers_data:
-                    layer_properties = self._proto_to_layer_properties(layer_proto)
-                    self._layers[layer_properties["name"]] = layer_properties
-                    self._add_layer_item(layer_properties["name"], layer_properties)
+                # Replace current layers with those from backend
+                self._load_rows(layers_data)
 
                 logger.info(f"Loaded {len(layers_data)} layers from backend")
             else:
@@ -635,37 +1003,64 @@ class LayersPanel(QWidget):
         except Exception as e:
             logger.error(f"Error loading layers from backend: {e}")
 
-    def _proto_to_layer_properties(self, layer_proto) -> Dict[str, Any]:
-        """Convert layer protobuf to layer properties dict."""
+    def _load_rows(self, layers_data: List[Dict[str, Any]]):
+        """
+        Replace all layers with layers received from the backend.
+
+        The new layers are converted in one pass and swapped in together,
+        so a bad entry leaves the current layers untouched.
+
+        Args:
+            layers_data: Layer protobuf dictionaries
+        """
+        layers = {}
+        for layer_proto in layers_data:
+            layer = self._proto_to_layer_properties(layer_proto)
+            layers[layer.name] = layer
+
+        self._layers.clear()
+        self._layers.update(layers)
+        self.layers_model.reset_layers()
+
+        # The current layer may not exist in the loaded document
+        if self._current_layer not in self._layers:
+            self._current_layer = None
+            fallback = "0" if "0" in self._layers else next(iter(self._layers), None)
+            if fallback is not None:
+                self.set_current_layer(fallback)
+            else:
+                self.current_label.setText("")
+                self.layers_model.set_current_layer(None)
+
+    def _proto_to_layer_properties(self, layer_proto) -> LayerProps:
+        """Convert layer protobuf to layer properties."""
         color_proto = layer_proto.get("color", {})
 
-        return {
-            "name": layer_proto.get("name", ""),
-            "color": QColor(
+        return LayerProps(
+            name=layer_proto.get("name", ""),
+            color=QColor(
                 color_proto.get("red", 255),
                 color_proto.get("green", 255),
                 color_proto.get("blue", 255),
                 color_proto.get("alpha", 255),
             ),
-            "line_type": layer_proto.get("line_type", "continuous"),
-            "line_weight": layer_proto.get("line_weight", 0.25),
-            "visible": layer_proto.get("visible", True),
-            "locked": layer_proto.get("locked", False),
-            "printable": layer_proto.get("printable", True),
-        }
+            line_type=layer_proto.get("line_type", "continuous"),
+            line_weight=layer_proto.get("line_weight", 0.25),
+            visible=layer_proto.get("visible", True),
+            locked=layer_proto.get("locked", False),
+            printable=layer_proto.get("printable", True),
+        )
 
     def _layer_properties_to_proto(self, layer_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert layer properties dict to protobuf format."""
-        color = layer_data.get("color", QColor(255, 255, 255))
+        color = layer_data.get("color")
+        if color is None:
+            color = self._DEFAULT_COLOR
+        red, green, blue, alpha = color.getRgb()
 
         return {
             "name": layer_data.get("name", ""),
-            "color": {
-                "red": color.red(),
-                "green": color.green(),
-                "blue": color.blue(),
-                "alpha": color.alpha(),
-            },
+            "color": {"red": red, "green": green, "blue": blue, "alpha": alpha},
             "line_type": layer_data.get("line_type", "continuous"),
             "line_weight": layer_data.get("line_weight", 0.25),
             "visible": layer_data.get("visible", True),
@@ -717,14 +1112,28 @@ class LayersPanel(QWidget):
         except Exception as e:
             logger.error(f"Error deleting layer from backend: {e}")
 
-    async def _update_layer_backend(self, layer_name: str, layer_data: Dict[str, Any]):
-        """Update layer in backend."""
-        if not self._api_client or not self._document_id:
+    async def _update_layer_backend(
+        self,
+        layer_name: str,
+        layer_data: Dict[str, Any],
+        document_id: Optional[str] = None,
+    ):
+        """
+        Update layer in backend.
+
+        Args:
+            layer_name: Name of the layer to update
+            layer_data: Layer properties to send
+            document_id: Document the update was made in, defaulting to the
+                current document
+        """
+        document_id = document_id or self._document_id
+        if not self._api_client or not document_id:
             return
 
         try:
             proto_data = self._layer_properties_to_proto(layer_data)
-            proto_data["document_id"] = self._document_id
+            proto_data["document_id"] = document_id
             proto_data["layer_id"] = layer_name
 
             response = await self._api_client.update_layer(proto_data)
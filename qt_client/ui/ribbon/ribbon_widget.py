@@ -17,6 +17,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from qt_client.ui.actions import ActionId
+
 logger = logging.getLogger(__name__)
 
 
@@ -193,7 +195,7 @@ class RibbonWidget(QTabWidget):
     """Main ribbon widget containing multiple tabs."""
 
     # Signals
-    action_triggered = Signal(str)  # action_name
+    action_triggered = Signal(int)  # ActionId
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -245,26 +247,26 @@ class RibbonWidget(QTabWidget):
 
         new_btn = file_group.add_large_button("New", "new")
         new_btn.setObjectName("new")
-        new_btn.clicked.connect(lambda: self.action_triggered.emit("new"))
+        new_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.NEW))
 
         open_btn = file_group.add_large_button("Open", "open")
         open_btn.setObjectName("open")
-        open_btn.clicked.connect(lambda: self.action_triggered.emit("open"))
+        open_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.OPEN))
 
         save_btn = file_group.add_large_button("Save", "save")
         save_btn.setObjectName("save")
-        save_btn.clicked.connect(lambda: self.action_triggered.emit("save"))
+        save_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.SAVE))
 
         # Clipboard group
         clipboard_group = home_tab.create_group("Clipboard")
 
         undo_btn = clipboard_group.add_small_button("Undo", "undo")
         undo_btn.setObjectName("undo")
-        undo_btn.clicked.connect(lambda: self.action_triggered.emit("undo"))
+        undo_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.UNDO))
 
         redo_btn = clipboard_group.add_small_button("Redo", "redo")
         redo_btn.setObjectName("redo")
-        redo_btn.clicked.connect(lambda: self.action_triggered.emit("redo"))
+        redo_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.REDO))
 
         # Drawing group
         drawing_group = home_tab.create_group("Drawing")
@@ -272,17 +274,17 @@ class RibbonWidget(QTabWidget):
         line_btn = drawing_group.add_large_button("Line", "line")
         line_btn.setObjectName("line")
         line_btn.setCheckable(True)
-        line_btn.clicked.connect(lambda: self.action_triggered.emit("line"))
+        line_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.LINE))
 
         circle_btn = drawing_group.add_large_button("Circle", "circle")
         circle_btn.setObjectName("circle")
         circle_btn.setCheckable(True)
-        circle_btn.clicked.connect(lambda: self.action_triggered.emit("circle"))
+        circle_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.CIRCLE))
 
         rect_btn = drawing_group.add_large_button("Rectangle", "rectangle")
         rect_btn.setObjectName("rectangle")
         rect_btn.setCheckable(True)
-        rect_btn.clicked.connect(lambda: self.action_triggered.emit("rectangle"))
+        rect_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.RECTANGLE))
 
         # Store action buttons
         self.action_buttons.update(
@@ -309,30 +311,30 @@ class RibbonWidget(QTabWidget):
 
         move_btn = transform_group.add_large_button("Move", "move")
         move_btn.setObjectName("move")
-        move_btn.clicked.connect(lambda: self.action_triggered.emit("move"))
+        move_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.MOVE))
 
         rotate_btn = transform_group.add_large_button("Rotate", "rotate")
         rotate_btn.setObjectName("rotate")
-        rotate_btn.clicked.connect(lambda: self.action_triggered.emit("rotate"))
+        rotate_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.ROTATE))
 
         scale_btn = transform_group.add_large_button("Scale", "scale")
         scale_btn.setObjectName("scale")
-        scale_btn.clicked.connect(lambda: self.action_triggered.emit("scale"))
+        scale_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.SCALE))
 
         # Modify group
         modify_group = modify_tab.create_group("Modify")
 
         trim_btn = modify_group.add_large_button("Trim", "trim")
         trim_btn.setObjectName("trim")
-        trim_btn.clicked.connect(lambda: self.action_triggered.emit("trim"))
+        trim_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.TRIM))
 
         extend_btn = modify_group.add_large_button("Extend", "extend")
         extend_btn.setObjectName("extend")
-        extend_btn.clicked.connect(lambda: self.action_triggered.emit("extend"))
+        extend_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.EXTEND))
 
         fillet_btn = modify_group.add_large_button("Fillet", "fillet")
         fillet_btn.setObjectName("fillet")
-        fillet_btn.clicked.connect(lambda: self.action_triggered.emit("fillet"))
+        fillet_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.FILLET))
 
         self.addTab(modify_tab, "Modify")
 
@@ -345,28 +347,32 @@ class RibbonWidget(QTabWidget):
 
         linear_dim_btn = dimensions_group.add_large_button("Linear", "dim_linear")
         linear_dim_btn.setObjectName("dim_linear")
-        linear_dim_btn.clicked.connect(lambda: self.action_triggered.emit("dim_linear"))
+        linear_dim_btn.clicked.connect(
+            lambda: self.action_triggered.emit(ActionId.DIM_LINEAR)
+        )
 
         angular_dim_btn = dimensions_group.add_large_button("Angular", "dim_angular")
         angular_dim_btn.setObjectName("dim_angular")
         angular_dim_btn.clicked.connect(
-            lambda: self.action_triggered.emit("dim_angular")
+            lambda: self.action_triggered.emit(ActionId.DIM_ANGULAR)
         )
 
         radius_dim_btn = dimensions_group.add_large_button("Radius", "dim_radius")
         radius_dim_btn.setObjectName("dim_radius")
-        radius_dim_btn.clicked.connect(lambda: self.action_triggered.emit("dim_radius"))
+        radius_dim_btn.clicked.connect(
+            lambda: self.action_triggered.emit(ActionId.DIM_RADIUS)
+        )
 
         # Text group
         text_group = annotate_tab.create_group("Text")
 
         text_btn = text_group.add_large_button("Text", "text")
         text_btn.setObjectName("text")
-        text_btn.clicked.connect(lambda: self.action_triggered.emit("text"))
+        text_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.TEXT))
 
         leader_btn = text_group.add_large_button("Leader", "leader")
         leader_btn.setObjectName("leader")
-        leader_btn.clicked.connect(lambda: self.action_triggered.emit("leader"))
+        leader_btn.clicked.connect(lambda: self.action_triggered.emit(ActionId.LEADER))
 
         self.addTab(annotate_tab, "Annotate")
 
@@ -379,15 +385,21 @@ class RibbonWidget(QTabWidget):
 
         zoom_in_btn = zoom_group.add_large_button("Zoom In", "zoom_in")
         zoom_in_btn.setObjectName("zoom_in")
-        zoom_in_btn.clicked.connect(lambda: self.action_triggered.emit("zoom_in"))
+        zoom_in_btn.clicked.connect(
+            lambda: self.action_triggered.emit(ActionId.ZOOM_IN)
+        )
 
         zoom_out_btn = zoom_group.add_large_button("Zoom Out", "zoom_out")
         zoom_out_btn.setObjectName("zoom_out")
-        zoom_out_btn.clicked.connect(lambda: self.action_triggered.emit("zoom_out"))
+        zoom_out_btn.clicked.connect(
+            lambda: self.action_triggered.emit(ActionId.ZOOM_OUT)
+        )
 
         zoom_fit_btn = zoom_group.add_large_button("Zoom Fit", "zoom_fit")
         zoom_fit_btn.setObjectName("zoom_fit")
-        zoom_fit_btn.clicked.connect(lambda: self.action_triggered.emit("zoom_fit"))
+        zoom_fit_btn.clicked.connect(
+            lambda: self.action_triggered.emit(ActionId.ZOOM_FIT)
+        )
 
         # Display group
         display_group = view_tab.create_group("Display")
@@ -396,13 +408,17 @@ class RibbonWidget(QTabWidget):
         grid_btn.setObjectName("grid")
         grid_btn.setCheckable(True)
         grid_btn.setChecked(True)
-        grid_btn.clicked.connect(lambda: self.action_triggered.emit("toggle_grid"))
+        grid_btn.clicked.connect(
+            lambda: self.action_triggered.emit(ActionId.TOGGLE_GRID)
+        )
 
         snap_btn = display_group.add_small_button("Snap", "snap")
         snap_btn.setObjectName("snap")
         snap_btn.setCheckable(True)
         snap_btn.setChecked(True)
-        snap_btn.clicked.connect(lambda: self.action_triggered.emit("toggle_snap"))
+        snap_btn.clicked.connect(
+            lambda: self.action_triggered.emit(ActionId.TOGGLE_SNAP)
+        )
 
         # Store additional action buttons
         self.action_buttons.update(
@@ -335,11 +335,11 @@ class LayerManagementTestApp(QMainWindow):
 
         info_text += "Layer Details:\n"
         for name, props in layers.items():
-            visible = "👁️" if props.get("visible", True) else "🚫"
-            locked = "🔒" if props.get("locked", False) else "🔓"
+            visible = "👁️" if props.visible else "🚫"
+            locked = "🔒" if props.locked else "🔓"
             current = "⭐" if name == current_layer else "  "
 
-            info_text += f"{current} {visible} {locked} {name} ({props.get('line_type', 'continuous')})\n"
+            info_text += f"{current} {visible} {locked} {name} ({props.line_type})\n"
 
         QMessageBox.information(self, "Layer Information", info_text)
 